@@ -5,13 +5,17 @@ from syd import Viewer
 
 
 class ViewerWithData(Viewer):
-    def __init__(self):
+    def __init__(self, load_delay=3.0):
         # In the object constructor, we load the data as an attribute.
         # This way the data is "ready" once you've created the viewer object.
-        self.dataset = [np.random.randn(100, 10000) for _ in range(10)]
+        # (float32 is plenty for plotting and takes half the memory of float64)
+        rng = np.random.default_rng()
+        self.dataset = [
+            rng.standard_normal((100, 10000), dtype=np.float32) for _ in range(10)
+        ]
 
-        # simulate a slow dataload... (1 second is enough delay to notice but not be super annoying for the example....)
-        time.sleep(3)
+        # simulate a slow dataload... (set load_delay=0 to skip it)
+        time.sleep(load_delay)
 
         # Add the syd parameters as usual
         self.add_integer(
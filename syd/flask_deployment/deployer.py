@@ -1,7 +1,12 @@
 import os
+import sys
 import json
+import gzip
+import hashlib
+import secrets
+from collections import OrderedDict
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -9,7 +14,6 @@ import io
 import webbrowser
 import threading
 import socket
-import warnings
 
 from flask import (
     Flask,
@@ -37,10 +41,189 @@ from ..parameters import (
     UnboundedFloatParameter,
     ButtonAction,
 )
-from ..support import ParameterUpdateWarning, plot_context
+from ..support import parameter_update_warnings, plot_context
 
 mpl.use("Agg")
 
+# Mimetype and Pillow encoder options for each supported plot image format.
+# Pillow's default PNG zlib level (6) costs ~35% more encode time than level 3
+# for only modestly smaller files.
+IMAGE_FORMATS = {
+    "png": ("image/png", {"compress_level": 3}),
+    "jpeg": ("image/jpeg", {"quality": 85}),
+    "webp": ("image/webp", {"quality": 85, "method": 4}),
+}
+
+
+# Number of encoded plot images kept for quickly revisiting recent states
+PLOT_CACHE_SIZE = 32
+
+# JSON responses at least this many bytes are gzipped for clients that accept it.
+# Plot images are already compressed, so they're sent as they are.
+JSON_GZIP_MIN_SIZE = 500
+JSON_GZIP_LEVEL = 4
+
+# How long browsers may reuse a plot image requested by its plot version
+PLOT_MAX_AGE = 3600
+
+# Type-specific fields sent to the frontend for each parameter type
+_PARAMETER_INFO = {
+    TextParameter: lambda p: {"type": "text"},
+    BooleanParameter: lambda p: {"type": "boolean"},
+    SelectionParameter: lambda p: {"type": "selection", "options": p.options},
+    MultipleSelectionParameter: lambda p: {
+        "type": "multiple-selection",
+        "options": p.options,
+    },
+    IntegerParameter: lambda p: {"type": "integer", "min": p.min, "max": p.max},
+    FloatParameter: lambda p: {
+        "type": "float",
+        "min": p.min,
+        "max": p.max,
+        "step": p.step,
+    },
+    IntegerRangeParameter: lambda p: {
+        "type": "integer-range",
+        "min": p.min,
+        "max": p.max,
+    },
+    FloatRangeParameter: lambda p: {
+        "type": "float-range",
+        "min": p.min,
+        "max": p.max,
+        "step": p.step,
+    },
+    UnboundedIntegerParameter: lambda p: {"type": "unbounded-integer"},
+    UnboundedFloatParameter: lambda p: {"type": "unbounded-float", "step": p.step},
+    ButtonAction: lambda p: {"type": "button", "is_action": True},
+}
+
+
+def _parse_text(param: TextParameter, value: Any) -> str:
+    return str(value)  # Ensure it's a string
+
+
+def _parse_boolean(param: BooleanParameter, value: Any) -> bool:
+    # Handle 'true'/'false' strings robustly
+    if isinstance(value, str):
+        if value.lower() == "true":
+            return True
+        if value.lower() == "false":
+            return False
+        # Try converting string numbers to bool (e.g., "1" -> True)
+        try:
+            return bool(int(value))
+        except ValueError:
+            pass  # Ignore if not int-like string
+    return bool(value)  # Standard bool conversion
+
+
+def _parse_integer(param: Parameter, value: Any) -> int:
+    return int(value)
+
+
+def _parse_float(param: Parameter, value: Any) -> float:
+    return float(value)
+
+
+def _parse_range(param: Parameter, value: Any) -> List[Any]:
+    # Ensure types match the parameter type
+    convert = int if isinstance(param, IntegerRangeParameter) else float
+    # Expect a list/tuple from JSON, e.g., [min, max]
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        return [convert(v) for v in value]
+    # Allow JSON string representation '[min, max]'
+    elif isinstance(value, str):
+        try:
+            parsed_list = json.loads(value)
+            if isinstance(parsed_list, list) and len(parsed_list) == 2:
+                return [convert(v) for v in parsed_list]
+            else:
+                raise ValueError("Range requires a list/tuple of two numbers.")
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON string for range: {value}")
+    else:
+        raise ValueError(
+            f"Invalid format for range parameter '{param.name}'. Expected list/tuple of two numbers or JSON string."
+        )
+
+
+def _parse_multiple_selection(
+    param: MultipleSelectionParameter, value: Any
+) -> List[Any]:
+    # Expect a list from JSON, e.g., ['a', 'b']
+    if isinstance(value, list):
+        # Options are validated by the parameter itself
+        return value
+    # Allow JSON string representation '["a", "b"]'
+    elif isinstance(value, str):
+        try:
+            parsed_list = json.loads(value)
+            if isinstance(parsed_list, list):
+                return parsed_list
+            else:
+                raise ValueError("Multiple selection requires a list.")
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON string for multiple selection: {value}")
+    else:
+        raise ValueError(
+            f"Invalid format for multiple selection parameter '{param.name}'. Expected list or JSON string list."
+        )
+
+
+def _parse_selection(param: SelectionParameter, value: Any) -> Any:
+    # Value needs to match one of the options *by type* if possible.
+    # Try direct match first.
+    if param._in_options(value):
+        return value
+
+    # Try converting the incoming value to the types options usually have, and
+    # return the option it equals (e.g. the option 3 for "3")
+    lookup = param._option_lookup()
+    for convert in (float, int, str):
+        try:
+            converted = convert(value)
+        except (ValueError, TypeError):
+            continue
+        if converted in lookup:
+            return lookup[converted]
+
+    # Slow path: allow for float inaccuracies against numeric options
+    try:
+        float_val = float(value)
+        for opt in param.options:
+            if isinstance(opt, (int, float)) and abs(float_val - float(opt)) < 1e-9:
+                return opt  # Return the original option instance
+    except (ValueError, TypeError):
+        pass
+
+    # If no match after trying conversions, raise error. Returning the original
+    # value might bypass validation.
+    raise ValueError(
+        f"Value '{value}' is not a valid option for '{param.name}'. Valid options: {param.options}"
+    )
+
+
+def _parse_action(param: ButtonAction, value: Any) -> None:
+    # Actions don't have a value to parse
+    return None
+
+
+# Converters from frontend values to parameter values for each parameter type
+_PARAMETER_PARSERS = {
+    TextParameter: _parse_text,
+    BooleanParameter: _parse_boolean,
+    SelectionParameter: _parse_selection,
+    MultipleSelectionParameter: _parse_multiple_selection,
+    IntegerParameter: _parse_integer,
+    FloatParameter: _parse_float,
+    IntegerRangeParameter: _parse_range,
+    FloatRangeParameter: _parse_range,
+    UnboundedIntegerParameter: _parse_integer,
+    UnboundedFloatParameter: _parse_float,
+    ButtonAction: _parse_action,
+}
+
 
 class ServerManager:
     def __init__(self):
@@ -131,6 +314,8 @@ class FlaskDeployer:
         open_browser: bool = True,
         update_threshold: float = 1.0,
         timeout_threshold: float = 10.0,
+        image_format: str = "png",
+        cache_plots: bool = True,
     ):
         """
         Initialize the Flask deployer.
@@ -165,6 +350,16 @@ class FlaskDeployer:
             Time in seconds to wait before showing the loading indicator (default: 1.0)
         timeout_threshold : float, optional
             Time in seconds to wait for the browser to open (default: 10.0).
+        image_format : str, optional
+            Image format used to send plots to the browser, either 'png', 'jpeg' or
+            'webp'. JPEG and WebP are smaller and faster to encode but lossy. Browsers
+            that don't accept the format are sent PNG instead (default: 'png').
+        cache_plots : bool, optional
+            Whether plot images can be reused for a state that was already plotted,
+            by the server and by the browser. Set to False if plot() depends on
+            more than the parameters (e.g. the time, random data or attributes
+            changed outside of the parameters), so every plot is rendered fresh
+            (default: True).
         """
         self.viewer = viewer
         self.suppress_warnings = suppress_warnings
@@ -180,6 +375,47 @@ class FlaskDeployer:
         )
         self.fig_dpi = fig_dpi
         self.debug = debug
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(
+                f"Invalid image format: {image_format}. Must be one of {list(IMAGE_FORMATS)}"
+            )
+        self.image_format = image_format
+        self.cache_plots = cache_plots
+
+        # The server is threaded but pyplot is not thread-safe, so renders are serialized
+        self._plot_lock = threading.Lock()
+
+        # Bumped after button actions, since their callbacks can change what the
+        # plot shows (e.g. by loading new data) without changing the state
+        self._state_version = 0
+
+        # Distinguishes this deployer's plot versions and ETags from those of
+        # earlier sessions that the browser may still have cached
+        self._session_token = secrets.token_hex(8)
+
+        # Bumped on every parameter update or action so that plot requests can
+        # tell whether the state moved on while they waited or rendered
+        self._state_generation = 0
+
+        # Bumped once per update request and sent back with the response, so the
+        # frontend can tell when the state was also changed by someone else
+        # (e.g. another browser tab) and reload all of it
+        self._update_version = 0
+
+        # Recently encoded plot images keyed by ETag, and the state that
+        # viewer.figure was last rendered for
+        self._plot_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._figure_state = None
+
+        # Whether matplotlib's one-time startup costs have been paid
+        self._warmed = False
+
+        # Rendered main page
+        self._index_html: Optional[bytes] = None
+
+        # Serialized /init-data response and the viewer revision it was built for
+        self._init_data: Optional[bytes] = None
+        self._init_data_key = None
 
         # Determine static and template folder paths
         package_dir = os.path.dirname(os.path.abspath(__file__))
@@ -213,34 +449,78 @@ class FlaskDeployer:
             log = logging.getLogger("werkzeug")
             log.setLevel(logging.ERROR)
 
+        @app.after_request
+        def compress_json(response):
+            """Gzip larger JSON responses (parameter info and state)."""
+            if response.mimetype != "application/json":
+                return response
+
+            response.vary.add("Accept-Encoding")
+            if (
+                response.status_code == 200
+                and not response.direct_passthrough
+                and "Content-Encoding" not in response.headers
+                and request.accept_encodings["gzip"]
+            ):
+                data = response.get_data()
+                if len(data) >= JSON_GZIP_MIN_SIZE:
+                    response.set_data(
+                        gzip.compress(data, compresslevel=JSON_GZIP_LEVEL)
+                    )
+                    response.headers["Content-Encoding"] = "gzip"
+                    # The body differs from the one the ETag was computed for
+                    etag, weak = response.get_etag()
+                    if etag and not weak:
+                        response.set_etag(etag, weak=True)
+            return response
+
         @app.route("/")
         def home():
             """Render the main page using the index.html template."""
-            # Pass the layout config to the template
-            return render_template("index.html", title="Syd Viewer", config=self.config)
+            # The page only depends on the layout config, so render it once
+            if self._index_html is None:
+                # Pass the layout config to the template
+                self._index_html = render_template(
+                    "index.html", title="Syd Viewer", config=self.config
+                ).encode()
+            response = app.response_class(self._index_html, mimetype="text/html")
+            response.add_etag()
+            response.headers["Cache-Control"] = "private, no-cache"
+            return response.make_conditional(request)
 
         @app.route("/init-data")
         def init_data():
             """Provide initial parameter information to the frontend."""
-            param_info = {
-                name: self._get_parameter_info(param)
-                for name, param in self.viewer.parameters.items()
-            }
-            # Get the order of parameters
-            param_order = list(self.viewer.parameters.keys())
-            # Also include the initial state and configuration
-            return jsonify(
-                {
-                    "params": param_info,
-                    "param_order": param_order,
-                    "state": self.viewer.state,
-                    "config": {
-                        "controls_position": self.config.controls_position,
-                        "controls_width_percent": self.config.controls_width_percent,
-                        "update_threshold": self.update_threshold,
-                    },
+            # Reuse the last response unless a parameter was added, removed or
+            # changed since it was built
+            key = (self.viewer._state_key(), self._update_version)
+            if self._init_data is None or key != self._init_data_key:
+                param_info = {
+                    name: self._get_parameter_info(param)
+                    for name, param in self.viewer.parameters.items()
                 }
-            )
+                # Get the order of parameters
+                param_order = list(self.viewer.parameters.keys())
+                # Also include the initial state and configuration
+                body = app.json.dumps(
+                    {
+                        "params": param_info,
+                        "param_order": param_order,
+                        "state": self.viewer.state,
+                        "state_version": self._update_version,
+                        "config": {
+                            "controls_position": self.config.controls_position,
+                            "controls_width_percent": self.config.controls_width_percent,
+                            "update_threshold": self.update_threshold,
+                        },
+                    }
+                ).encode()
+                self._init_data = body
+                self._init_data_key = key
+
+            response = app.response_class(self._init_data, mimetype="application/json")
+            response.add_etag()
+            return response.make_conditional(request)
 
         @app.route("/plot")
         def plot():
@@ -252,30 +532,73 @@ class FlaskDeployer:
                 app.logger.warning("Plot requested while parameters are updating.")
 
             try:
-                # Generate the plot using the current state from the viewer instance
-                # The _plot_context ensures plt state is managed correctly.
-                with plot_context():
-                    # Use the viewer's plot method with its current state
-                    fig = self.viewer.plot(self.viewer.state)
-                    self.viewer._figure = fig
-                    if not isinstance(fig, mpl.figure.Figure):
-                        raise TypeError(
-                            f"viewer.plot() must return a matplotlib Figure, but got {type(fig)}"
+                image_format = self._negotiate_image_format()
+
+                # Render and tag a single snapshot of the state (read after the
+                # generation, so later updates are noticed below)
+                generation = self._state_generation
+                state = self.viewer.state
+
+                # Let the browser reuse its copy if nothing changed since it was sent
+                version = self._plot_version(state)
+                etag = self._plot_etag(version, image_format)
+                if self.cache_plots and request.if_none_match.contains(etag):
+                    response = make_response("", 304)
+                    response.set_etag(etag)
+                    return response
+
+                mimetype, pil_kwargs = IMAGE_FORMATS[image_format]
+                with self._plot_lock:
+                    # Serve recently visited states without rendering. This also
+                    # lets identical concurrent requests share a single render.
+                    image = self._plot_cache.get(etag) if self.cache_plots else None
+                    if image is not None:
+                        self._plot_cache.move_to_end(etag)
+                    elif self._state_generation != generation:
+                        # The state changed while this request was waiting, so
+                        # the client will ask for the new plot anyway
+                        return self._stale_plot_response()
+                    else:
+                        fig = self._render_figure(state)
+
+                        # Save the plot to a buffer
+                        buf = io.BytesIO()
+                        fig.savefig(
+                            buf,
+                            format=image_format,
+                            bbox_inches="tight",
+                            dpi=self.fig_dpi,
+                            pil_kwargs=dict(pil_kwargs),
                         )
-
-                # Save the plot to a buffer
-                buf = io.BytesIO()
-                fig.savefig(buf, format="png", bbox_inches="tight", dpi=self.fig_dpi)
-                buf.seek(0)
-                plt.close(fig)  # Ensure figure is closed
-
-                # Return the image as a response
-                response = make_response(send_file(buf, mimetype="image/png"))
-                response.headers["Cache-Control"] = (
-                    "no-cache, no-store, must-revalidate"
+                        plt.close(fig)  # Ensure figure is closed
+
+                        image = buf.getvalue()
+                        if self.cache_plots:
+                            self._plot_cache[etag] = image
+                            if len(self._plot_cache) > PLOT_CACHE_SIZE:
+                                self._plot_cache.popitem(last=False)
+
+                        # Don't send a plot that went stale while rendering
+                        # (it stays cached in case the state comes back)
+                        if self._state_generation != generation:
+                            return self._stale_plot_response()
+
+                # Return the image as a response. If the URL names the plot
+                # version it shows, browsers can reuse it for that URL directly,
+                # otherwise they must revalidate with the ETag first.
+                response = make_response(
+                    send_file(io.BytesIO(image), mimetype=mimetype)
                 )
-                response.headers["Pragma"] = "no-cache"
-                response.headers["Expires"] = "0"
+                if not self.cache_plots:
+                    response.headers["Cache-Control"] = "no-store"
+                    return response
+                response.set_etag(etag)
+                if request.args.get("v") == version:
+                    response.headers["Cache-Control"] = (
+                        f"private, max-age={PLOT_MAX_AGE}, immutable"
+                    )
+                else:
+                    response.headers["Cache-Control"] = "private, no-cache"
                 return response
 
             except Exception as e:
@@ -287,24 +610,11 @@ class FlaskDeployer:
         def update_param():
             """Handle parameter updates or actions triggered from the frontend."""
             if self._updating:
-                # Prevent processing new updates if already updating (potential cycle)
-                app.logger.warning(
-                    "Update requested while already processing an update."
-                )
-                # Return current state to avoid frontend hanging.
-                return (
-                    jsonify(
-                        {
-                            "success": False,
-                            "error": "Server busy processing previous update.",
-                            "state": self.viewer.state,
-                        }
-                    ),
-                    429,
-                )  # Too Many Requests
+                return self._busy_response()
 
             try:
                 self._updating = True  # Set base class flag
+                self._update_version += 1
 
                 data = request.get_json()
                 name = data.get("name")
@@ -315,74 +625,200 @@ class FlaskDeployer:
                     app.logger.error(f"Invalid parameter name received: {name}")
                     return jsonify({"error": f"Parameter '{name}' not found"}), 404
 
-                parameter = self.viewer.parameters[name]
-                replot = True
-
                 # Optionally suppress warnings during updates
-                with warnings.catch_warnings():
-                    if self.suppress_warnings:
-                        warnings.filterwarnings(
-                            "ignore", category=ParameterUpdateWarning
+                with parameter_update_warnings(self.suppress_warnings):
+                    try:
+                        replot = self._apply_update(name, value, action)
+                    except (ValueError, TypeError, json.JSONDecodeError) as e:
+                        if action:
+                            raise
+                        app.logger.error(
+                            f"Error parsing value for parameter '{name}': {e}"
                         )
+                        return (
+                            jsonify({"error": f"Invalid value format for {name}: {e}"}),
+                            400,
+                        )
+
+                # State might have changed due to callbacks, return the *final* state
+                return jsonify(self._update_response(replot))
+
+            except Exception as e:
+                app.logger.error(
+                    f"Error updating parameter '{name}': {str(e)}", exc_info=True
+                )
+                # Return the state *before* the error if possible? Or just error.
+                return (
+                    jsonify(
+                        {
+                            "error": f"Server error updating parameter: {str(e)}",
+                            "state": self.viewer.state,
+                        }
+                    ),
+                    500,
+                )
+            finally:
+                self._updating = False  # Clear base class flag
+
+        @app.route("/update-params", methods=["POST"])
+        def update_params():
+            """Apply a list of parameter updates or actions in a single request.
+
+            Updates are applied in order. Each one gets an entry in "results" so
+            that one invalid update doesn't discard the rest of the batch.
+            """
+            if self._updating:
+                return self._busy_response()
 
-                    if action:
-                        # Handle button actions: directly call the callback
-                        if isinstance(parameter, ButtonAction) and parameter.callback:
-                            # Pass the current state dictionary to the callback
-                            parameter.callback(self.viewer.state)
-                            replot = parameter.replot
-                        else:
-                            app.logger.warning(
-                                f"Received action request for non-action parameter: {name}"
+            try:
+                self._updating = True
+                self._update_version += 1
+
+                updates = request.get_json()
+                if not isinstance(updates, list):
+                    return jsonify({"error": "Expected a list of updates"}), 400
+
+                results = []
+                replot = False
+                with parameter_update_warnings(self.suppress_warnings):
+                    for update in updates:
+                        if not (
+                            isinstance(update, dict)
+                            and isinstance(update.get("name"), str)
+                        ):
+                            app.logger.error(f"Invalid update received: {update}")
+                            error = (
+                                f"Invalid update (expected a name and value): {update}"
                             )
-                    else:
-                        # Handle regular parameter updates: parse and set value
+                            results.append({"name": None, "error": error})
+                            continue
+
+                        name = update["name"]
+                        if not name or name not in self.viewer.parameters:
+                            app.logger.error(f"Invalid parameter name received: {name}")
+                            results.append(
+                                {"name": name, "error": f"Parameter '{name}' not found"}
+                            )
+                            continue
+
+                        action = update.get("action", False)
                         try:
-                            parsed_value = self._parse_parameter_value(name, value)
-                            # Use base class method to set value and trigger callbacks
-                            self.viewer.set_parameter_value(name, parsed_value)
+                            replot |= self._apply_update(
+                                name, update.get("value", None), action
+                            )
                         except (ValueError, TypeError, json.JSONDecodeError) as e:
+                            if action:
+                                raise
                             app.logger.error(
                                 f"Error parsing value for parameter '{name}': {e}"
                             )
-                            return (
-                                jsonify(
-                                    {"error": f"Invalid value format for {name}: {e}"}
-                                ),
-                                400,
+                            results.append(
+                                {
+                                    "name": name,
+                                    "error": f"Invalid value format for {name}: {e}",
+                                }
                             )
+                            continue
+                        results.append({"name": name, "success": True})
 
-                # State might have changed due to callbacks, return the *final* state
-                final_state = self.viewer.state
-                final_param_info = {
-                    name: self._get_parameter_info(param)
-                    for name, param in self.viewer.parameters.items()
-                }
-                return jsonify(
-                    {
-                        "success": True,
-                        "state": final_state,
-                        "params": final_param_info,
-                        "replot": replot,
-                    }
-                )
+                response = self._update_response(replot)
+                response["results"] = results
+                return jsonify(response)
 
             except Exception as e:
-                app.logger.error(
-                    f"Error updating parameter '{name}': {str(e)}", exc_info=True
-                )
-                # Return the state *before* the error if possible? Or just error.
+                app.logger.error(f"Error updating parameters: {str(e)}", exc_info=True)
                 return (
                     jsonify(
                         {
-                            "error": f"Server error updating parameter: {str(e)}",
+                            "error": f"Server error updating parameters: {str(e)}",
                             "state": self.viewer.state,
                         }
                     ),
                     500,
                 )
             finally:
-                self._updating = False  # Clear base class flag
+                self._updating = False
+
+    def _apply_update(self, name: str, value: Any, action: bool = False) -> bool:
+        """Apply one parameter update or action and return whether to replot.
+
+        Raises ValueError, TypeError or json.JSONDecodeError if the value can't
+        be parsed for the parameter.
+        """
+        parameter = self.viewer.parameters[name]
+        if not action:
+            # Handle regular parameter updates: parse and set value
+            parsed_value = self._parse_parameter_value(name, value)
+            # Use base class method to set value and trigger callbacks
+            self.viewer.set_parameter_value(name, parsed_value)
+            self._state_generation += 1
+            return True
+
+        # Handle button actions: directly call the callback
+        if not (isinstance(parameter, ButtonAction) and parameter.callback):
+            self.app.logger.warning(
+                f"Received action request for non-action parameter: {name}"
+            )
+            return True
+
+        # Cached plots don't update viewer.figure, so make sure callbacks
+        # (e.g. saving the figure) see the figure for the current state
+        state = self.viewer.state
+        self._refresh_figure(state)
+        # Pass the current state dictionary to the callback
+        parameter.callback(state)
+
+        # The callback may have changed what the plot shows
+        with self._plot_lock:
+            self._state_version += 1
+            self._plot_cache.clear()
+        self._state_generation += 1
+        return parameter.replot
+
+    def _update_response(self, replot: bool) -> Dict[str, Any]:
+        """The state and parameter info that changed, to send back after updates.
+
+        This includes changes made by callbacks (or by plot) since the last
+        response, the frontend already has everything else. The state version
+        lets the frontend notice changes that were reported to someone else.
+        """
+        changed = self.viewer._pop_changed_parameters()
+        parameters = self.viewer.parameters
+        state = self.viewer.state
+        return {
+            "success": True,
+            "state": {name: state[name] for name in changed if name in state},
+            "params": {
+                name: self._get_parameter_info(parameters[name])
+                for name in changed
+                if name in parameters
+            },
+            "replot": replot,
+            "plot_version": self._plot_version(state),
+            "state_version": self._update_version,
+        }
+
+    def _stale_plot_response(self):
+        """Empty response for a plot request that was overtaken by an update."""
+        response = make_response("", 204)
+        response.headers["X-Retry"] = "1"
+        return response
+
+    def _busy_response(self):
+        """Response for updates requested while another one is being processed."""
+        # Prevent processing new updates if already updating (potential cycle)
+        self.app.logger.warning("Update requested while already processing an update.")
+        # Return current state to avoid frontend hanging.
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "error": "Server busy processing previous update.",
+                    "state": self.viewer.state,
+                }
+            ),
+            429,
+        )  # Too Many Requests
 
     def display(
         self,
@@ -396,8 +832,6 @@ class FlaskDeployer:
                 "Flask app not built. Call build_layout() before display()."
             )
 
-        print(self.port, self.host)
-
         # Find an available port if none is specified
         self.host = host or socket.gethostbyname(socket.gethostname())
         self.port = port or _find_available_port(address=self.host)
@@ -431,6 +865,10 @@ class FlaskDeployer:
         # build_layout creates the Flask app and routes
         self.build_layout()
 
+        # Pay matplotlib's one-time startup costs while the server starts, a
+        # /plot request that comes in first just waits for the plot lock
+        threading.Thread(target=self._warm_up_matplotlib, daemon=True).start()
+
         # Initial plot generation is handled implicitly when the first client connects
         # and requests /plot. We don't need an explicit initial self.update_plot() call here,
         # though the base class might call it if not overridden. Let's rely on the
@@ -444,78 +882,99 @@ class FlaskDeployer:
             open_browser=self.open_browser,
         )
 
+    def _warm_up_matplotlib(self) -> None:
+        """Render a throwaway figure to load the font cache, Agg and the encoder."""
+        with self._plot_lock:
+            if self._warmed:
+                return
+            with plot_context():
+                fig = plt.figure()
+                fig.text(0.5, 0.5, "syd")
+            pil_kwargs = IMAGE_FORMATS[self.image_format][1]
+            fig.savefig(
+                io.BytesIO(),
+                format=self.image_format,
+                dpi=self.fig_dpi,
+                pil_kwargs=dict(pil_kwargs),
+            )
+            plt.close(fig)
+            self._warmed = True
+
+    def _render_figure(self, state: Dict[str, Any]) -> mpl.figure.Figure:
+        """Call the viewer's redraw or plot method (with the plot lock held)."""
+        # The _plot_context ensures plt state is managed correctly.
+        with plot_context():
+            # Update the last figure in place if the viewer supports it
+            fig = self.viewer._figure
+            if fig is not None and self._figure_state is not None:
+                if self.viewer.redraw(state) is not NotImplemented:
+                    self._figure_state = (self._state_version, state)
+                    return fig
+
+            fig = self.viewer.plot(state)
+            self.viewer._figure = fig
+            if not isinstance(fig, mpl.figure.Figure):
+                raise TypeError(
+                    f"viewer.plot() must return a matplotlib Figure, but got {type(fig)}"
+                )
+        self._figure_state = (self._state_version, state)
+        return fig
+
+    def _refresh_figure(self, state: Dict[str, Any]) -> None:
+        """Render viewer.figure again if it doesn't match the given state."""
+        with self._plot_lock:
+            if self._figure_state != (self._state_version, state):
+                plt.close(self._render_figure(state))
+
+    def _plot_version(self, state: Dict[str, Any]) -> str:
+        """Identify the plot that would be rendered for this state."""
+        if not self.cache_plots:
+            # Plots may differ even for the same state, so never share a version
+            return secrets.token_hex(8)
+        key = (self._session_token, self._state_version, sorted(state.items()))
+        return hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+
+    def _plot_etag(self, version: str, image_format: str) -> str:
+        """Identify the plot image for a plot version in a given format."""
+        return f"{version}-{image_format}-{self.fig_dpi}"
+
+    def _negotiate_image_format(self) -> str:
+        """Use the configured image format unless the client doesn't accept it."""
+        mimetype = IMAGE_FORMATS[self.image_format][0]
+        accept = request.accept_mimetypes
+        if self.image_format != "png" and accept and not accept[mimetype]:
+            return "png"
+        return self.image_format
+
     def _get_parameter_info(self, param: Parameter) -> Dict[str, Any]:
         """
         Convert a Parameter object to a dictionary of information for the frontend.
-        (Identical to original, kept for clarity)
         """
-        # Add name/label
         info = {
             "name": param.name,
             "value": param.value,
         }
 
-        if isinstance(param, TextParameter):
-            info.update({"type": "text"})
-        elif isinstance(param, BooleanParameter):
-            info.update({"type": "boolean"})
-        elif isinstance(param, SelectionParameter):
-            info.update({"type": "selection", "options": param.options})
-        elif isinstance(param, MultipleSelectionParameter):
-            info.update(
-                {
-                    "type": "multiple-selection",
-                    "options": param.options,
-                }
-            )
-        elif isinstance(param, IntegerParameter):
-            info.update(
-                {
-                    "type": "integer",
-                    "min": param.min,
-                    "max": param.max,
-                }
-            )
-        elif isinstance(param, FloatParameter):
-            info.update(
-                {
-                    "type": "float",
-                    "min": param.min,
-                    "max": param.max,
-                    "step": param.step,
-                }
-            )
-        elif isinstance(param, IntegerRangeParameter):
-            info.update(
-                {
-                    "type": "integer-range",
-                    "min": param.min,
-                    "max": param.max,
-                }
-            )
-        elif isinstance(param, FloatRangeParameter):
-            info.update(
-                {
-                    "type": "float-range",
-                    "min": param.min,
-                    "max": param.max,
-                    "step": param.step,
-                }
-            )
-        elif isinstance(param, UnboundedIntegerParameter):
-            info.update({"type": "unbounded-integer"})
-        elif isinstance(param, UnboundedFloatParameter):
-            info.update({"type": "unbounded-float", "step": param.step})
-        elif isinstance(param, ButtonAction):
-            # Button doesn't have a 'value' in the same way, label is important
-            info.update({"type": "button", "is_action": True})
-            # Remove 'value' as it's not applicable
-            info.pop("value", None)
-        else:
+        get_info = _PARAMETER_INFO.get(type(param))
+        if get_info is None:
+            # Fall back to matching by class name (e.g. after a module reload)
+            param_type_name = type(param).__name__
+            for key_class, value_func in _PARAMETER_INFO.items():
+                if key_class.__name__ == param_type_name:
+                    get_info = value_func
+                    break
+
+        if get_info is None:
             # Fallback for unknown types
             info.update(
                 {"type": "unknown", "value": str(param.value)}
             )  # Keep value as string
+        else:
+            info.update(get_info(param))
+
+        if info.get("is_action", False):
+            # Button doesn't have a 'value' in the same way, label is important
+            info.pop("value", None)
 
         return info
 
@@ -532,135 +991,20 @@ class FlaskDeployer:
 
         param = self.viewer.parameters[name]
 
-        # Handle specific types
-        try:
-            if isinstance(param, TextParameter):
-                return str(value)  # Ensure it's a string
-            elif isinstance(param, BooleanParameter):
-                # Handle 'true'/'false' strings robustly
-                if isinstance(value, str):
-                    if value.lower() == "true":
-                        return True
-                    if value.lower() == "false":
-                        return False
-                    # Try converting string numbers to bool (e.g., "1" -> True)
-                    try:
-                        return bool(int(value))
-                    except ValueError:
-                        pass  # Ignore if not int-like string
-                return bool(value)  # Standard bool conversion
-            elif isinstance(param, (IntegerParameter, UnboundedIntegerParameter)):
-                return int(value)
-            elif isinstance(param, (FloatParameter, UnboundedFloatParameter)):
-                return float(value)
-            elif isinstance(param, (IntegerRangeParameter, FloatRangeParameter)):
-                # Expect a list/tuple from JSON, e.g., [min, max]
-                if isinstance(value, (list, tuple)) and len(value) == 2:
-                    # Ensure types match the parameter type
-                    if isinstance(param, IntegerRangeParameter):
-                        return [int(v) for v in value]
-                    else:  # FloatRangeParameter
-                        return [float(v) for v in value]
-                # Allow JSON string representation '[min, max]'
-                elif isinstance(value, str):
-                    try:
-                        parsed_list = json.loads(value)
-                        if isinstance(parsed_list, list) and len(parsed_list) == 2:
-                            if isinstance(param, IntegerRangeParameter):
-                                return [int(v) for v in parsed_list]
-                            else:
-                                return [float(v) for v in parsed_list]
-                        else:
-                            raise ValueError(
-                                "Range requires a list/tuple of two numbers."
-                            )
-                    except json.JSONDecodeError:
-                        raise ValueError(f"Invalid JSON string for range: {value}")
-                else:
-                    raise ValueError(
-                        f"Invalid format for range parameter '{name}'. Expected list/tuple of two numbers or JSON string."
-                    )
-
-            elif isinstance(param, MultipleSelectionParameter):
-                # Expect a list from JSON, e.g., ['a', 'b']
-                if isinstance(value, list):
-                    # Ensure options are valid? Base Parameter class might do this.
-                    # Return as is for now.
-                    return value
-                # Allow JSON string representation '["a", "b"]'
-                elif isinstance(value, str):
-                    try:
-                        parsed_list = json.loads(value)
-                        if isinstance(parsed_list, list):
-                            return parsed_list
-                        else:  # Allow single non-list value to be wrapped? No, spec is list.
-                            raise ValueError("Multiple selection requires a list.")
-                    except json.JSONDecodeError:
-                        # Handle case where a single string value might be sent for a multi-select
-                        # if the frontend logic is imperfect. Treat as a list with one item?
-                        # Let's be strict for now.
-                        raise ValueError(
-                            f"Invalid JSON string for multiple selection: {value}"
-                        )
-                else:
-                    # If it's not a list or valid JSON string, treat as empty list? Or error?
-                    # Error seems safer.
-                    raise ValueError(
-                        f"Invalid format for multiple selection parameter '{name}'. Expected list or JSON string list."
-                    )
-
-            elif isinstance(param, SelectionParameter):
-                # Value needs to match one of the options *by type* if possible.
-                # The original logic was quite complex. Let's simplify:
-                # Try direct match first.
-                if value in param.options:
-                    return value
-
-                # Try converting the incoming value to the types present in options.
-                option_types = {type(opt) for opt in param.options}
+        parse = _PARAMETER_PARSERS.get(type(param))
+        if parse is None:
+            # Fall back to matching by class name (e.g. after a module reload)
+            param_type_name = type(param).__name__
+            for key_class, parse_func in _PARAMETER_PARSERS.items():
+                if key_class.__name__ == param_type_name:
+                    parse = parse_func
+                    break
 
-                # Prioritize type conversion based on options
-                if float in option_types:
-                    try:
-                        float_val = float(value)
-                        # Check if float matches any option (handle float inaccuracies)
-                        for opt in param.options:
-                            if (
-                                isinstance(opt, (int, float))
-                                and abs(float_val - float(opt)) < 1e-9
-                            ):
-                                return opt  # Return the original option instance
-                        # If no close match, but float conversion worked, maybe return float_val?
-                        # Let's stick to returning existing options.
-                    except (ValueError, TypeError):
-                        pass
-
-                if int in option_types:
-                    try:
-                        int_val = int(value)
-                        if int_val in param.options:
-                            return int_val
-                    except (ValueError, TypeError):
-                        pass
-
-                if str in option_types:
-                    str_val = str(value)
-                    if str_val in param.options:
-                        return str_val
-
-                # If no match after trying conversions, raise error. Let Parameter handle validation.
-                # Returning the original value might bypass validation.
-                raise ValueError(
-                    f"Value '{value}' is not a valid option for '{name}'. Valid options: {param.options}"
-                )
-
-            elif isinstance(param, ButtonAction):
-                # Actions don't have a value to parse
-                return None  # Or raise error? None seems okay.
-
-            else:
+        try:
+            if parse is None:
                 # Fallback for unknown - return as is, let Parameter validate
                 return value
+            return parse(param, value)
 
         except (ValueError, TypeError, json.JSONDecodeError) as e:
             # Re-raise with more context
@@ -671,29 +1015,34 @@ class FlaskDeployer:
 
 def _find_available_port(
     start_port=5000,
-    max_attempts=1000,
     address: str = "127.0.0.1",
 ):
     """
-    Find an available port starting from start_port.
+    Find an available port, preferring start_port.
+
+    If start_port is in use, the OS assigns a free port instead. The port isn't
+    held, the server binds it again right after.
     """
-    for port in range(start_port, start_port + max_attempts):
+    for port in (start_port, 0):
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                # Check if the port is usable
+                if sys.platform == "win32":
+                    # On Windows SO_REUSEADDR would let the probe bind a port that
+                    # another process is listening on, so ask for exclusive use
+                    s.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+                else:
+                    # Like the server, allow reusing ports left in TIME_WAIT
+                    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                 s.bind((address, port))
                 # If bind succeeds, the port is available
-                return port
+                return s.getsockname()[1]
         except OSError as e:
-            # If error is Address already in use, try next port
+            # If error is Address already in use, let the OS pick a port
             if e.errno == socket.errno.EADDRINUSE:
-                # print(f"Port {port} already in use.") # Optional debug msg
                 continue
             else:
                 # Re-raise other OS errors
                 raise e
 
-    # If loop finishes without finding a port
-    raise RuntimeError(
-        f"Could not find an available port between {start_port} and {start_port + max_attempts - 1}"
-    )
+    # If neither worked
+    raise RuntimeError(f"Could not find an available port on {address}")
@@ -1,6 +1,6 @@
 import { updateStatus } from './utils.js';
-import { initializeState, updateStateFromServer } from './state.js';
-import { updatePlot } from './plot.js';
+import { initializeState, applyServerChanges } from './state.js';
+import { updatePlot, setPlotVersion } from './plot.js';
 import { setUpdateThreshold } from './config.js';
 
 /**
@@ -9,11 +9,7 @@ import { setUpdateThreshold } from './config.js';
  */
 export async function fetchInitialData() {
     try {
-        const response = await fetch('/init-data');
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
-        }
-        const data = await response.json();
+        const data = await fetchCurrentData();
 
         setUpdateThreshold(data.config.update_threshold); // Set initial threshold
         initializeState(data); // Initialize state
@@ -26,6 +22,17 @@ export async function fetchInitialData() {
     }
 }
 
+/**
+ * Fetch the current parameter information and state from the server.
+ */
+export async function fetchCurrentData() {
+    const response = await fetch('/init-data');
+    if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+    }
+    return await response.json();
+}
+
 /**
  * Send parameter update to the server.
  * @param {string} name - The name of the parameter.
@@ -56,6 +63,32 @@ export async function updateParameterOnServer(name, value, action = false) {
     }
 }
 
+/**
+ * Send several parameter updates to the server in one request.
+ * @param {Array<{name: string, value: *}>} updates - The updates, applied in order.
+ */
+export async function updateParametersOnServer(updates) {
+    try {
+        const response = await fetch('/update-params', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(updates),
+        });
+        if (!response.ok) {
+            const error = new Error(`HTTP error! status: ${response.status}`);
+            error.status = response.status; // Lets the caller retry if the server was busy
+            throw error;
+        }
+        return await response.json(); // Return the server response
+    } catch (error) {
+        console.error('Error updating parameters:', error);
+        updateStatus('Error updating parameters');
+        throw error; // Re-throw error
+    }
+}
+
 /**
  * Handles button click actions by sending to the server.
  * @param {string} name - The name of the button parameter.
@@ -75,7 +108,8 @@ export function handleButtonClick(name) {
                 updateStatus(`Error processing ${name}`);
             } else {
                 // Update state with any changes from callbacks
-                updateStateFromServer(data.state, data.params);
+                applyServerChanges(data);
+                setPlotVersion(data.plot_version);
                 if (data.replot) {
                     updatePlot();
                 }
@@ -3,11 +3,22 @@ import { updateThreshold } from './config.js';
 import { updateStatus, createSlowLoadingImage } from './utils.js';
 
 let loadingTimeout = null; // Timeout for showing loading state
+let latestPlotRequest = 0; // Id of the most recent plot request
+let plotVersion = null; // Server's id for the plot of the latest state it sent
+
+/**
+ * Set the plot version from a server update response.
+ * Plot URLs that include it can be cached by the browser.
+ */
+export function setPlotVersion(version) {
+    plotVersion = version || null;
+}
 
 /**
  * Update the plot with current state
+ * @param {boolean} [isRetry=false] - Whether this retries a plot that went stale.
  */
-export function updatePlot() {
+export function updatePlot(isRetry = false) {
     const plotImage = document.getElementById('plot-image');
     if (!plotImage) {
         console.warn("Plot image element not found");
@@ -39,13 +50,22 @@ export function updatePlot() {
         }
     }
 
+    if (plotVersion && !isRetry) {
+        queryParams.append('v', plotVersion);
+    }
+
     // Set the image source to the plot endpoint with parameters
     const url = `/plot?${queryParams.toString()}`;
 
     // Use an Image object to preload and handle load/error events
     const newImage = new Image();
+    const requestId = ++latestPlotRequest;
 
     newImage.onload = function() {
+        // Ignore plots that were superseded by a newer request
+        if (requestId !== latestPlotRequest) {
+            return;
+        }
         // Clear loading timeout if it hasn't fired yet
         if (loadingTimeout) {
             clearTimeout(loadingTimeout);
@@ -59,6 +79,15 @@ export function updatePlot() {
     };
 
     newImage.onerror = function() {
+        if (requestId !== latestPlotRequest) {
+            return;
+        }
+        // The server sends no image if the state changed while it was rendering,
+        // so ask once more for the plot of the current state
+        if (!isRetry) {
+            updatePlot(true);
+            return;
+        }
         // Clear loading timeout
         if (loadingTimeout) {
             clearTimeout(loadingTimeout);
@@ -1,6 +1,6 @@
 import { updateControlValue } from './ui_controls.js';
-import { updatePlot } from './plot.js';
-import { updateParameterOnServer } from './api.js';
+import { updatePlot, setPlotVersion } from './plot.js';
+import { updateParametersOnServer, fetchCurrentData } from './api.js';
 import { updateStatus } from './utils.js';
 
 export let state = {};
@@ -8,16 +8,32 @@ export let paramInfo = {};
 export let paramOrder = [];
 let isUpdating = false;
 
+// Version of the server state this page has seen. The server bumps it once per
+// update request, so a response that skips a version means someone else (e.g.
+// another tab) changed the state too.
+let stateVersion = 0;
+
 // Function to initialize state (called after fetching initial data)
 export function initializeState(initialData) {
     paramInfo = initialData.params;
     paramOrder = initialData.param_order;
+    stateVersion = initialData.state_version;
     // Initialize state from parameter info
     for (const [name, param] of Object.entries(paramInfo)) {
         state[name] = param.value;
     }
 }
 
+// Only one update request is in flight at a time. Changes made while a request is
+// in flight are queued (only the latest value per parameter is kept) and sent
+// together in one request when it returns, so the final values always reach the
+// server and stale intermediate values are skipped.
+let requestInFlight = false;
+const pendingUpdates = new Map();
+
+// How long to wait before resending updates the server was too busy to apply
+const BUSY_RETRY_DELAY_MS = 100;
+
 /**
  * Update a parameter value and send to server
  */
@@ -26,30 +42,109 @@ export function updateParameter(name, value) {
     if (isUpdating) {
         return;
     }
-    // Indicate status update
-    updateStatus('Updating ' + name + '...');
 
     // Update local state
     state[name] = value;
 
-    // Send update to server (from api.js)
-    updateParameterOnServer(name, value)
+    // Queue the update (re-inserting keeps the queue in order of latest change)
+    pendingUpdates.delete(name);
+    pendingUpdates.set(name, value);
+
+    if (!requestInFlight) {
+        sendNextUpdate();
+    }
+}
+
+/**
+ * Send all queued parameter updates to the server
+ */
+function sendNextUpdate() {
+    const updates = Array.from(pendingUpdates, ([name, value]) => ({ name, value }));
+    pendingUpdates.clear();
+    requestInFlight = true;
+
+    // Indicate status update
+    updateStatus('Updating ' + updates.map(update => update.name).join(', ') + '...');
+
+    // Send updates to server (from api.js)
+    let retryDelay = 0;
+    updateParametersOnServer(updates)
         .then(data => {
             if (data.error) {
                 console.error('Error:', data.error);
             } else {
+                for (const result of data.results) {
+                    if (result.error) {
+                        console.error('Error:', result.error);
+                    }
+                }
                 // Update state with any changes from callbacks
-                updateStateFromServer(data.state, data.params);
-                // Update plot
-                updatePlot();
+                applyServerChanges(data);
+                setPlotVersion(data.plot_version);
+                // Only plot once the queue has drained, newer updates are coming
+                if (pendingUpdates.size === 0) {
+                    updatePlot();
+                }
             }
         })
         .catch(error => {
             console.error('Error:', error);
+            if (error.status === 429) {
+                // The server was busy and applied none of these updates, so queue
+                // them again ahead of newer changes (which take precedence)
+                const requeued = new Map();
+                for (const { name, value } of updates) {
+                    if (!pendingUpdates.has(name)) {
+                        requeued.set(name, value);
+                    }
+                }
+                for (const [name, value] of pendingUpdates) {
+                    requeued.set(name, value);
+                }
+                pendingUpdates.clear();
+                for (const [name, value] of requeued) {
+                    pendingUpdates.set(name, value);
+                }
+                retryDelay = BUSY_RETRY_DELAY_MS;
+            }
+        })
+        .finally(() => {
+            requestInFlight = false;
+            if (pendingUpdates.size > 0 && retryDelay > 0) {
+                setTimeout(() => {
+                    // A newer change may have sent the queue in the meantime
+                    if (!requestInFlight && pendingUpdates.size > 0) {
+                        sendNextUpdate();
+                    }
+                }, retryDelay);
+            } else if (pendingUpdates.size > 0) {
+                sendNextUpdate();
+            } else {
+                updateStatus('Ready!');
+            }
         });
+}
 
-    // Indicate status update
-    updateStatus('Ready!');
+/**
+ * Apply the changes reported in an update response. The response only includes
+ * what changed since the previous update response, so if it skipped a version
+ * the full state is reloaded to pick up changes that were reported elsewhere.
+ */
+export function applyServerChanges(data) {
+    updateStateFromServer(data.state, data.params);
+
+    const inSync = data.state_version === stateVersion + 1;
+    stateVersion = Math.max(stateVersion, data.state_version);
+    if (!inSync) {
+        fetchCurrentData()
+            .then(fullData => {
+                stateVersion = Math.max(stateVersion, fullData.state_version);
+                updateStateFromServer(fullData.state, fullData.params);
+            })
+            .catch(error => {
+                console.error('Error reloading state:', error);
+            });
+    }
 }
 
 /**
@@ -60,18 +155,21 @@ export function updateStateFromServer(serverState, serverParamInfo) {
     isUpdating = true;
 
     try {
-        // Update global paramInfo first if it changed
+        // Update global paramInfo first. The server only sends info for the
+        // parameters that changed, so merge it in.
         if (serverParamInfo) {
-            // Basic check: update if stringified versions differ. Might need deeper comparison.
-            if(JSON.stringify(paramInfo) !== JSON.stringify(serverParamInfo)) {
-                paramInfo = serverParamInfo;
-                 // TODO: Potentially re-create controls if param info structure changed significantly?
-                 // For now, we only update values below.
-            }
+            paramInfo = { ...paramInfo, ...serverParamInfo };
+            // TODO: Potentially re-create controls if param info structure changed significantly?
+            // For now, we only update values below.
         }
 
-        // Update any parameters that changed due to callbacks
+        // Update the parameters that changed (including any changed by callbacks)
         for (const [name, value] of Object.entries(serverState)) {
+            // Don't overwrite local changes that haven't been sent yet
+            if (pendingUpdates.has(name)) {
+                continue;
+            }
+
             // Check if state value changed OR if paramInfo for this specific param changed
             const currentParamInfoStr = paramInfo[name] ? JSON.stringify(paramInfo[name]) : undefined;
             const serverParamInfoStr = serverParamInfo && serverParamInfo[name] ? JSON.stringify(serverParamInfo[name]) : undefined;
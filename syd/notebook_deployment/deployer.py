@@ -1,13 +1,15 @@
-from typing import Literal, Optional
+from typing import Any, Callable, Dict, Iterable, Literal, Optional
+from functools import partial
 import warnings
 import threading
 from contextlib import contextmanager
 import ipywidgets as widgets
 from IPython.display import display
+from IPython.core.formatters import format_display_data
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 
-from ..support import ParameterUpdateWarning, plot_context
+from ..support import parameter_update_warnings, plot_context
 from ..viewer import Viewer
 from .widgets import create_widget, BaseWidget
 
@@ -44,6 +46,7 @@ class NotebookDeployer:
     ):
         self.viewer = viewer
         self.components: dict[str, BaseWidget] = {}
+        self._observers: Dict[str, Callable] = {}
         self.suppress_warnings = suppress_warnings
         self._updating = False  # Flag to check circular updates
         self.controls_position = controls_position
@@ -57,6 +60,7 @@ class NotebookDeployer:
                 "The behavior of the viewer will almost definitely not work as expected!"
             )
         self._last_figure = None
+        self._last_plotted_state = None
         self._update_event = threading.Event()
         self.update_threshold = update_threshold
         self._slow_loading_figure = None
@@ -114,12 +118,28 @@ class NotebookDeployer:
 
     def build_components(self) -> None:
         """Create widget instances for all parameters and equip callbacks."""
+        # Drop the callbacks of a previous deployment before rebuilding
+        self.teardown()
+
+        # Components start out matching the parameters
+        self.viewer._pop_changed_parameters()
         for name, param in self.viewer.parameters.items():
             widget = create_widget(param)
             self.components[name] = widget
-            callback = lambda _, n=name: self.handle_component_engagement(n)
+            callback = partial(self._handle_component_change, name)
+            self._observers[name] = callback
             widget.observe(callback)
 
+    def teardown(self) -> None:
+        """Detach the deployer's callbacks from all components."""
+        for name, callback in self._observers.items():
+            self.components[name].unobserve(callback)
+        self._observers.clear()
+
+    def _handle_component_change(self, name: str, _) -> None:
+        """Route a widget change event to handle_component_engagement."""
+        self.handle_component_engagement(name)
+
     def build_layout(self) -> None:
         """Create the main layout combining controls and plot."""
 
@@ -137,7 +157,7 @@ class NotebookDeployer:
                 min=10,
                 max=50,
                 description="Controls Width %",
-                continuous=True,
+                continuous_update=True,
                 layout=widgets.Layout(width="95%"),
                 style={"description_width": "initial"},
             )
@@ -234,10 +254,7 @@ class NotebookDeployer:
         with self._perform_update():
             self._update_status(f"Updating {name}")
             # Optionally suppress warnings during parameter updates
-            with warnings.catch_warnings():
-                if self.suppress_warnings:
-                    warnings.filterwarnings("ignore", category=ParameterUpdateWarning)
-
+            with parameter_update_warnings(self.suppress_warnings):
                 # Get the component
                 component = self.components[name]
                 if component.is_action:
@@ -248,37 +265,79 @@ class NotebookDeployer:
                 else:
                     # Otherwise, update the parameter value
                     self.viewer.set_parameter_value(name, component.value)
-                    replot = True
-
-                # Update any components that changed due to dependencies
-                self.sync_components_with_state()
+                    # Skip the plot if the update settled back on the plotted state
+                    state = self.viewer.state
+                    replot = state != self._last_plotted_state
+
+                # Update any components that changed due to dependencies. Action
+                # callbacks are arbitrary code that may change parameters without
+                # going through the viewer, so check every component after them.
+                changed = self.viewer._pop_changed_parameters()
+                if component.is_action:
+                    self.sync_components_with_state()
+                else:
+                    self.sync_components_with_state(names=changed)
 
                 # Update the plot
                 if replot:
-                    self.update_plot()
-
-    def sync_components_with_state(self, exclude: Optional[str] = None) -> None:
-        """Sync component values with viewer state."""
-        for name, parameter in self.viewer.parameters.items():
+                    self.update_plot(None if component.is_action else state)
+
+    def sync_components_with_state(
+        self, exclude: Optional[str] = None, names: Optional[Iterable[str]] = None
+    ) -> None:
+        """Sync component values with viewer state.
+
+        If names is provided, only those components are synced (e.g. the
+        parameters that changed), otherwise all of them are.
+        """
+        # Local lookups keep the per-parameter loop cheap
+        parameters = self.viewer.parameters
+        components = self.components
+        if names is None:
+            names = parameters
+        for name in names:
             if name == exclude:
                 continue
+            parameter = parameters.get(name)
+            if parameter is None:
+                continue
 
-            component = self.components[name]
+            component = components[name]
             if not component.matches_parameter(parameter):
                 component.update_from_parameter(parameter)
 
-    def update_plot(self) -> None:
-        """Update the plot with current state."""
-        state = self.viewer.state
+    def update_plot(self, state: Optional[Dict[str, Any]] = None) -> None:
+        """Update the plot with current state.
 
-        with plot_context():
-            figure = self.viewer.plot(state)
-            self.viewer._figure = figure
+        The state can be passed in if the caller already has it, otherwise it is
+        read from the viewer.
+        """
+        if state is None:
+            state = self.viewer.state
+        self._last_plotted_state = state
+
+        # Update the current figure in place if the viewer supports it
+        figure = self._last_figure
+        redrawn = False
+        if figure is not None:
+            with plot_context():
+                redrawn = self.viewer.redraw(state) is not NotImplemented
+
+        if not redrawn:
+            with plot_context():
+                figure = self.viewer.plot(state)
+                self.viewer._figure = figure
 
         # Update components if plot function updated a parameter
-        self.sync_components_with_state()
+        changed = self.viewer._pop_changed_parameters()
+        if changed:
+            self.sync_components_with_state(names=changed)
 
-        self._display_figure(figure)
+        if redrawn and self.backend_type == "widget":
+            # The canvas is already on screen, it just needs to repaint
+            figure.canvas.draw_idle()
+        else:
+            self._display_figure(figure)
 
         self._showing_new_figure = True
 
@@ -288,25 +347,31 @@ class NotebookDeployer:
             if self._last_figure is not None:
                 plt.close(self._last_figure)
 
-            self.plot_output.clear_output(wait=True)
-            with self.plot_output:
-                if self.backend_type == "inline":
-                    display(figure)
-
-                    # Also required to make sure a second figure window isn't opened
-                    plt.close(figure)
-
-                elif self.backend_type == "widget":
-                    display(figure.canvas)
+            if self.backend_type == "inline":
+                # Swap the rendered image in with a single outputs update rather
+                # than a clear_output + display pair
+                data, metadata = format_display_data(figure)
+                self.plot_output.outputs = (
+                    {"output_type": "display_data", "data": data, "metadata": metadata},
+                )
 
-                else:
-                    display(figure)
-                    plt.close(figure)
-                    print(
-                        f"Backend type: ({self.backend_type}) is not explicitly supported."
-                        "If you encounter weird behavior, try restarting with '%matplotlib inline' or '%matplotlib widget'."
-                        "And please report this issue on github please :)."
-                    )
+                # Also required to make sure a second figure window isn't opened
+                plt.close(figure)
+
+            else:
+                self.plot_output.clear_output(wait=True)
+                with self.plot_output:
+                    if self.backend_type == "widget":
+                        display(figure.canvas)
+
+                    else:
+                        display(figure)
+                        plt.close(figure)
+                        print(
+                            f"Backend type: ({self.backend_type}) is not explicitly supported."
+                            "If you encounter weird behavior, try restarting with '%matplotlib inline' or '%matplotlib widget'."
+                            "And please report this issue on github please :)."
+                        )
 
             if store_figure:
                 self._last_figure = figure
@@ -31,8 +31,11 @@ class BaseWidget(Generic[T, W], ABC):
     for widgets that correspond to different parameter types.
     """
 
+    # Deployers hold one widget per parameter, no need for a __dict__ on each
+    __slots__ = ("_widget", "_updating", "_callbacks")
+
     _widget: W
-    _callbacks: List[Dict[str, Union[Callable, Union[str, List[str]]]]]
+    _callbacks: List[Callable]
     is_action: bool = False
 
     def __init__(
@@ -49,7 +52,7 @@ class BaseWidget(Generic[T, W], ABC):
             description_width,
         )
         self._updating = False  # Flag to prevent circular updates
-        # List of callbacks to remember for quick disabling/enabling
+        # Callbacks called by a single observer on the widget
         self._callbacks = []
 
     @abstractmethod
@@ -85,13 +88,13 @@ class BaseWidget(Generic[T, W], ABC):
     def update_from_parameter(self, parameter: T) -> None:
         """Update the widget from the parameter."""
         try:
-            self._updating = True
             self.disable_callbacks()
-            self.extra_updates_from_parameter(parameter)
-            self.value = parameter.value
+            # Send all changed traits (options, bounds, value) in one message
+            with self._widget.hold_sync():
+                self.extra_updates_from_parameter(parameter)
+                self.value = parameter.value
         finally:
             self.reenable_callbacks()
-            self._updating = False
 
     def extra_updates_from_parameter(self, parameter: T) -> None:
         """Extra updates from the parameter."""
@@ -99,30 +102,37 @@ class BaseWidget(Generic[T, W], ABC):
 
     def observe(self, callback: Callable) -> None:
         """Observe the widget and call the callback when the value changes."""
-        full_callback = dict(handler=callback, names="value")
-        self._widget.observe(**full_callback)
-        self._callbacks.append(full_callback)
+        if not self._callbacks:
+            self._widget.observe(self._notify_callbacks, names="value")
+        self._callbacks.append(callback)
 
     def unobserve(self, callback: Callable[[Any], None]) -> None:
         """Unobserve the widget and stop calling the callback when the value changes."""
-        full_callback = dict(handler=callback, names="value")
-        self._widget.unobserve(**full_callback)
-        self._callbacks.remove(full_callback)
+        self._callbacks.remove(callback)
+        if not self._callbacks:
+            self._widget.unobserve(self._notify_callbacks, names="value")
+
+    def _notify_callbacks(self, change: Dict[str, Any]) -> None:
+        """Call the callbacks unless the widget is being updated programmatically."""
+        if self._updating:
+            return
+        for callback in self._callbacks:
+            callback(change)
 
     def reenable_callbacks(self) -> None:
         """Reenable all callbacks from the widget."""
-        for callback in self._callbacks:
-            self._widget.observe(**callback)
+        self._updating = False
 
     def disable_callbacks(self) -> None:
         """Disable all callbacks from the widget."""
-        for callback in self._callbacks:
-            self._widget.unobserve(**callback)
+        self._updating = True
 
 
 class TextWidget(BaseWidget[TextParameter, widgets.Text]):
     """Widget for text parameters."""
 
+    __slots__ = ()
+
     def _create_widget(
         self,
         parameter: TextParameter,
@@ -133,7 +143,7 @@ class TextWidget(BaseWidget[TextParameter, widgets.Text]):
         return widgets.Text(
             value=parameter.value,
             description=parameter.name,
-            continuous=False,
+            continuous_update=False,
             layout=widgets.Layout(width=width, margin=margin),
             style={"description_width": description_width},
         )
@@ -142,6 +152,8 @@ class TextWidget(BaseWidget[TextParameter, widgets.Text]):
 class BooleanWidget(BaseWidget[BooleanParameter, widgets.ToggleButton]):
     """Widget for boolean parameters."""
 
+    __slots__ = ()
+
     def _create_widget(
         self,
         parameter: BooleanParameter,
@@ -160,6 +172,8 @@ class BooleanWidget(BaseWidget[BooleanParameter, widgets.ToggleButton]):
 class SelectionWidget(BaseWidget[SelectionParameter, widgets.Dropdown]):
     """Widget for single selection parameters."""
 
+    __slots__ = ()
+
     @staticmethod
     def _encode_options(options: List[Any]) -> List[Any]:
         return [_NONE_SENTINEL if o is None else o for o in options]
@@ -204,6 +218,9 @@ class SelectionWidget(BaseWidget[SelectionParameter, widgets.Dropdown]):
     def extra_updates_from_parameter(self, parameter: SelectionParameter) -> None:
         """Extra updates from the parameter."""
         new_options = self._encode_options(parameter.options)
+        # Reassigning options rebuilds the whole dropdown, so only do it on change
+        if self._widget.options == tuple(new_options):
+            return
         current_value = self._widget.value
         new_value = current_value if current_value in new_options else new_options[0]
         self._widget.options = new_options
@@ -215,6 +232,8 @@ class MultipleSelectionWidget(
 ):
     """Widget for multiple selection parameters."""
 
+    __slots__ = ()
+
     @staticmethod
     def _encode_options(options: List[Any]) -> List[Any]:
         return [_NONE_SENTINEL if o is None else o for o in options]
@@ -264,6 +283,9 @@ class MultipleSelectionWidget(
     ) -> None:
         """Extra updates from the parameter."""
         new_options = self._encode_options(parameter.options)
+        # Reassigning options rebuilds the whole list, so only do it on change
+        if self._widget.options == tuple(new_options):
+            return
         current_values = set(self._widget.value)
         new_values = [v for v in current_values if v in new_options]
         self._widget.options = new_options
@@ -273,6 +295,8 @@ class MultipleSelectionWidget(
 class IntegerWidget(BaseWidget[IntegerParameter, widgets.IntSlider]):
     """Widget for integer parameters."""
 
+    __slots__ = ()
+
     def _create_widget(
         self,
         parameter: IntegerParameter,
@@ -303,19 +327,23 @@ class IntegerWidget(BaseWidget[IntegerParameter, widgets.IntSlider]):
 
     def extra_updates_from_parameter(self, parameter: IntegerParameter) -> None:
         """Update the widget attributes from the parameter."""
-        current_value = self._widget.value
-        if parameter.min > self._widget.max:
-            self._widget.max = parameter.min + 1
-        if parameter.max < self._widget.min:
-            self._widget.min = parameter.max - 1
-        self._widget.min = parameter.min
-        self._widget.max = parameter.max
-        self.value = max(parameter.min, min(parameter.max, current_value))
+        # Bounds and value are validated together once they are all set
+        with self._widget.hold_trait_notifications():
+            current_value = self._widget.value
+            if parameter.min > self._widget.max:
+                self._widget.max = parameter.min + 1
+            if parameter.max < self._widget.min:
+                self._widget.min = parameter.max - 1
+            self._widget.min = parameter.min
+            self._widget.max = parameter.max
+            self.value = max(parameter.min, min(parameter.max, current_value))
 
 
 class FloatWidget(BaseWidget[FloatParameter, widgets.FloatSlider]):
     """Widget for float parameters."""
 
+    __slots__ = ()
+
     def _create_widget(
         self,
         parameter: FloatParameter,
@@ -347,20 +375,24 @@ class FloatWidget(BaseWidget[FloatParameter, widgets.FloatSlider]):
 
     def extra_updates_from_parameter(self, parameter: FloatParameter) -> None:
         """Update the widget attributes from the parameter."""
-        current_value = self._widget.value
-        if parameter.min > self._widget.max:
-            self._widget.max = parameter.min + 1
-        if parameter.max < self._widget.min:
-            self._widget.min = parameter.max - 1
-        self._widget.min = parameter.min
-        self._widget.max = parameter.max
-        self._widget.step = parameter.step
-        self.value = max(parameter.min, min(parameter.max, current_value))
+        # Bounds and value are validated together once they are all set
+        with self._widget.hold_trait_notifications():
+            current_value = self._widget.value
+            if parameter.min > self._widget.max:
+                self._widget.max = parameter.min + 1
+            if parameter.max < self._widget.min:
+                self._widget.min = parameter.max - 1
+            self._widget.min = parameter.min
+            self._widget.max = parameter.max
+            self._widget.step = parameter.step
+            self.value = max(parameter.min, min(parameter.max, current_value))
 
 
 class IntegerRangeWidget(BaseWidget[IntegerRangeParameter, widgets.IntRangeSlider]):
     """Widget for integer range parameters."""
 
+    __slots__ = ()
+
     def _create_widget(
         self,
         parameter: IntegerRangeParameter,
@@ -394,22 +426,26 @@ class IntegerRangeWidget(BaseWidget[IntegerRangeParameter, widgets.IntRangeSlide
 
     def extra_updates_from_parameter(self, parameter: IntegerRangeParameter) -> None:
         """Update the widget attributes from the parameter."""
-        low, high = self._widget.value
-        if parameter.min > self._widget.max:
-            self._widget.max = parameter.min + 1
-        if parameter.max < self._widget.min:
-            self._widget.min = parameter.max - 1
-        self._widget.min = parameter.min
-        self._widget.max = parameter.max
-        # Ensure values stay within bounds
-        low = max(parameter.min, min(parameter.max, low))
-        high = max(parameter.min, min(parameter.max, high))
-        self.value = [low, high]
+        # Bounds and value are validated together once they are all set
+        with self._widget.hold_trait_notifications():
+            low, high = self._widget.value
+            if parameter.min > self._widget.max:
+                self._widget.max = parameter.min + 1
+            if parameter.max < self._widget.min:
+                self._widget.min = parameter.max - 1
+            self._widget.min = parameter.min
+            self._widget.max = parameter.max
+            # Ensure values stay within bounds
+            low = max(parameter.min, min(parameter.max, low))
+            high = max(parameter.min, min(parameter.max, high))
+            self.value = [low, high]
 
 
 class FloatRangeWidget(BaseWidget[FloatRangeParameter, widgets.FloatRangeSlider]):
     """Widget for float range parameters."""
 
+    __slots__ = ()
+
     def _create_widget(
         self,
         parameter: FloatRangeParameter,
@@ -444,23 +480,27 @@ class FloatRangeWidget(BaseWidget[FloatRangeParameter, widgets.FloatRangeSlider]
 
     def extra_updates_from_parameter(self, parameter: FloatRangeParameter) -> None:
         """Update the widget attributes from the parameter."""
-        low, high = self._widget.value
-        if parameter.min > self._widget.max:
-            self._widget.max = parameter.min + 1
-        if parameter.max < self._widget.min:
-            self._widget.min = parameter.max - 1
-        self._widget.min = parameter.min
-        self._widget.max = parameter.max
-        self._widget.step = parameter.step
-        # Ensure values stay within bounds
-        low = max(parameter.min, min(parameter.max, low))
-        high = max(parameter.min, min(parameter.max, high))
-        self.value = [low, high]
+        # Bounds and value are validated together once they are all set
+        with self._widget.hold_trait_notifications():
+            low, high = self._widget.value
+            if parameter.min > self._widget.max:
+                self._widget.max = parameter.min + 1
+            if parameter.max < self._widget.min:
+                self._widget.min = parameter.max - 1
+            self._widget.min = parameter.min
+            self._widget.max = parameter.max
+            self._widget.step = parameter.step
+            # Ensure values stay within bounds
+            low = max(parameter.min, min(parameter.max, low))
+            high = max(parameter.min, min(parameter.max, high))
+            self.value = [low, high]
 
 
 class UnboundedIntegerWidget(BaseWidget[UnboundedIntegerParameter, widgets.IntText]):
     """Widget for unbounded integer parameters."""
 
+    __slots__ = ()
+
     def _create_widget(
         self,
         parameter: UnboundedIntegerParameter,
@@ -489,6 +529,8 @@ class UnboundedIntegerWidget(BaseWidget[UnboundedIntegerParameter, widgets.IntTe
 class UnboundedFloatWidget(BaseWidget[UnboundedFloatParameter, widgets.FloatText]):
     """Widget for unbounded float parameters."""
 
+    __slots__ = ()
+
     def _create_widget(
         self,
         parameter: UnboundedFloatParameter,
@@ -516,6 +558,8 @@ class UnboundedFloatWidget(BaseWidget[UnboundedFloatParameter, widgets.FloatText
 class ButtonWidget(BaseWidget[ButtonAction, widgets.Button]):
     """Widget for button parameters."""
 
+    __slots__ = ()
+
     is_action: bool = True
 
     def _create_widget(
@@ -553,13 +597,21 @@ class ButtonWidget(BaseWidget[ButtonAction, widgets.Button]):
         self._widget.on_click(callback, remove=True)
         self._callbacks = []
 
-    def reenable_callbacks(self) -> None:
-        """Reenable all callbacks from the widget."""
-        self._widget.on_click(self._callbacks)
 
-    def disable_callbacks(self) -> None:
-        """Disable all callbacks from the widget."""
-        self._widget.on_click(self._callbacks, remove=True)
+# Widget implementation for each parameter type
+_WIDGET_CLASSES = {
+    TextParameter: TextWidget,
+    SelectionParameter: SelectionWidget,
+    MultipleSelectionParameter: MultipleSelectionWidget,
+    BooleanParameter: BooleanWidget,
+    IntegerParameter: IntegerWidget,
+    FloatParameter: FloatWidget,
+    IntegerRangeParameter: IntegerRangeWidget,
+    FloatRangeParameter: FloatRangeWidget,
+    UnboundedIntegerParameter: UnboundedIntegerWidget,
+    UnboundedFloatParameter: UnboundedFloatWidget,
+    ButtonAction: ButtonWidget,
+}
 
 
 def create_widget(
@@ -591,27 +643,13 @@ def create_widget(
     ValueError
         If no widget implementation exists for the given parameter type.
     """
-    widget_map = {
-        TextParameter: TextWidget,
-        SelectionParameter: SelectionWidget,
-        MultipleSelectionParameter: MultipleSelectionWidget,
-        BooleanParameter: BooleanWidget,
-        IntegerParameter: IntegerWidget,
-        FloatParameter: FloatWidget,
-        IntegerRangeParameter: IntegerRangeWidget,
-        FloatRangeParameter: FloatRangeWidget,
-        UnboundedIntegerParameter: UnboundedIntegerWidget,
-        UnboundedFloatParameter: UnboundedFloatWidget,
-        ButtonAction: ButtonWidget,
-    }
-
     # Try direct type lookup first
-    widget_class = widget_map.get(type(parameter))
+    widget_class = _WIDGET_CLASSES.get(type(parameter))
 
     # If that fails, try matching by class name
     if widget_class is None:
         param_type_name = type(parameter).__name__
-        for key_class, value_class in widget_map.items():
+        for key_class, value_class in _WIDGET_CLASSES.items():
             if key_class.__name__ == param_type_name:
                 widget_class = value_class
                 break
@@ -620,7 +658,7 @@ def create_widget(
         raise ValueError(
             f"No widget implementation for parameter type: {type(parameter)}\n"
             f"Parameter type name: {type(parameter).__name__}\n"
-            f"Available types: {[k.__name__ for k in widget_map.keys()]}"
+            f"Available types: {[k.__name__ for k in _WIDGET_CLASSES.keys()]}"
         )
 
     return widget_class(
@@ -14,6 +14,15 @@ from .support import (
 
 T = TypeVar("T")
 
+# Bumped whenever any parameter's value is set, so that cached states (see
+# Viewer.state) notice values assigned directly to a parameter too
+_value_revision = 0
+
+
+def _get_value_revision() -> int:
+    """Get the counter that changes whenever any parameter's value is set."""
+    return _value_revision
+
 
 @dataclass
 class Parameter(Generic[T], ABC, metaclass=ParameterMeta):
@@ -72,7 +81,9 @@ class Parameter(Generic[T], ABC, metaclass=ParameterMeta):
         ValueError
             If the new value is invalid for this parameter type
         """
+        global _value_revision
         self._value = self._validate(new_value)
+        _value_revision += 1
 
     @abstractmethod
     def _validate(self, new_value: Any) -> T:
@@ -331,6 +342,36 @@ class SelectionParameter(Parameter[Any]):
             )
         return list(options)
 
+    def _option_lookup(self) -> Dict[Any, Any]:
+        """
+        Hashed copy of options for fast membership checks.
+
+        Maps each option to itself (the first of any equal options), so a value
+        that equals an option can be resolved to that option, e.g. 3.0 to 3.
+        Rebuilt whenever options is replaced or resized, so it stays in sync
+        with updates that assign a new options list.
+        """
+        cache = getattr(self, "_option_cache", None)
+        if (
+            cache is None
+            or cache[0] is not self.options
+            or cache[1] != len(self.options)
+        ):
+            lookup = {}
+            for option in self.options:
+                lookup.setdefault(option, option)
+            cache = (self.options, len(self.options), lookup)
+            self._option_cache = cache
+        return cache[2]
+
+    def _in_options(self, value: Any) -> bool:
+        """Check if value is one of the options."""
+        try:
+            return value in self._option_lookup()
+        except TypeError:
+            # Unhashable values can't match any (hashable) option
+            return False
+
     def _validate(self, new_value: Any) -> Any:
         """
         Validate that value is one of the allowed options.
@@ -345,7 +386,7 @@ class SelectionParameter(Parameter[Any]):
             ValueError: If value is not in options list
         """
         # Direct check for non-float values or when new_value is exactly in options
-        if new_value in self.options:
+        if self._in_options(new_value):
             return new_value
 
         # Special handling for numeric values to account for type mismatches
@@ -394,7 +435,7 @@ class SelectionParameter(Parameter[Any]):
         self.options = self._validate_options(self.options)
 
         # Check if value is directly in options
-        if self.value in self.options:
+        if self._in_options(self.value):
             return
 
         # For numeric values, try flexible comparison
@@ -527,6 +568,31 @@ class MultipleSelectionParameter(Parameter[List[Any]]):
             )
         return list(options)
 
+    def _option_set(self) -> frozenset:
+        """
+        Hashed copy of options for fast membership checks.
+
+        Rebuilt whenever options is replaced or resized, so it stays in sync
+        with updates that assign a new options list.
+        """
+        cache = getattr(self, "_option_cache", None)
+        if (
+            cache is None
+            or cache[0] is not self.options
+            or cache[1] != len(self.options)
+        ):
+            cache = (self.options, len(self.options), frozenset(self.options))
+            self._option_cache = cache
+        return cache[2]
+
+    def _in_options(self, value: Any) -> bool:
+        """Check if value is one of the options."""
+        try:
+            return value in self._option_set()
+        except TypeError:
+            # Unhashable values can't match any (hashable) option
+            return False
+
     def _validate(self, new_value: Any) -> List[Any]:
         """
         Validate list of selected values against options.
@@ -546,11 +612,12 @@ class MultipleSelectionParameter(Parameter[List[Any]]):
         """
         if not isinstance(new_value, (list, tuple)):
             raise TypeError(f"Value must be a list or tuple")
-        invalid = [val for val in new_value if val not in self.options]
+        invalid = [val for val in new_value if not self._in_options(val)]
         if invalid:
             raise ValueError(f"Values {invalid} not in options: {self.options}")
         # Keep only unique values while preserving order based on self.options
-        return [x for x in self.options if x in new_value]
+        selected = set(new_value)
+        return [x for x in self.options if x in selected]
 
     def _validate_update(self) -> None:
         self.options = self._validate_options(self.options)
@@ -561,8 +628,8 @@ class MultipleSelectionParameter(Parameter[List[Any]]):
                 f"For parameter {self.name}, value {self.value} is not a list or tuple. Setting to empty list.",
             )
             self.value = []
-        if not all(val in self.options for val in self.value):
-            invalid = [val for val in self.value if val not in self.options]
+        if not all(self._in_options(val) for val in self.value):
+            invalid = [val for val in self.value if not self._in_options(val)]
             warn_parameter_update(
                 self.name,
                 type(self).__name__,
@@ -1,8 +1,7 @@
 from abc import ABCMeta
 from typing import Any, List, Union
-from warnings import warn
+from warnings import warn, catch_warnings, filterwarnings
 from contextlib import contextmanager
-import matplotlib.pyplot as plt
 
 
 def show_open_servers():
@@ -32,16 +31,38 @@ def close_servers(port: Union[int, None] = None):
 
 @contextmanager
 def plot_context():
-    plt.ioff()
+    """Turn off interactive mode while plotting, restoring it afterwards."""
+    # On demand import so that importing syd doesn't load pyplot
+    import matplotlib.pyplot as plt
+
+    was_interactive = plt.isinteractive()
+    if was_interactive:
+        plt.ioff()
     try:
         yield
     finally:
-        plt.ion()
+        if was_interactive:
+            plt.ion()
+
+
+@contextmanager
+def parameter_update_warnings(suppress: bool):
+    """Ignore ParameterUpdateWarning in the block if suppress is True.
+
+    The global warnings filters are only saved and restored when suppressing.
+    """
+    if not suppress:
+        yield
+        return
+    with catch_warnings():
+        filterwarnings("ignore", category=ParameterUpdateWarning)
+        yield
 
 
 class NoUpdate:
     """Singleton class to represent a non-update in parameter operations."""
 
+    __slots__ = ()
     _instance = None
     _noupdate_identifier = "NO_UPDATE"
 
@@ -64,6 +85,7 @@ class NoUpdate:
 class NoInitialValue:
     """Singleton class to represent a non-initial value in parameter operations."""
 
+    __slots__ = ()
     _instance = None
     _noinitialvalue_identifier = "NO_INITIAL_VALUE"
 
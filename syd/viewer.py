@@ -1,12 +1,25 @@
-from typing import List, Any, Callable, Dict, Tuple, Union, Optional, Literal
+from typing import (
+    TYPE_CHECKING,
+    List,
+    Any,
+    Callable,
+    Dict,
+    Tuple,
+    Union,
+    Optional,
+    Literal,
+)
 from functools import wraps, partial
 import inspect
 from contextlib import contextmanager
-from matplotlib.figure import Figure
 
-from .parameters import ParameterType, ActionType, Parameter
+from .parameters import ParameterType, ActionType, Parameter, _get_value_revision
 from .support import NoUpdate, NoInitialValue, ParameterAddError, ParameterUpdateError
 
+if TYPE_CHECKING:
+    # Only needed for annotations, so importing syd doesn't load matplotlib
+    from matplotlib.figure import Figure
+
 # Create the singleton instances
 NO_UPDATE = NoUpdate()
 NO_INITIAL_VALUE = NoInitialValue()
@@ -85,44 +98,50 @@ def validate_parameter_operation(
                 f"Invalid operation type specified ({operation}) for method {func.__name__}"
             )
 
+        # Resolve everything that doesn't depend on the call once, up front
+        is_add = operation == "add"
+        error_class = ParameterAddError if is_add else ParameterUpdateError
+        type_name = parameter_type.name
+        expected_class = parameter_type.value
+
         @wraps(func)
         def wrapper(self: "Viewer", name: Any, *args, **kwargs):
             # Validate parameter name is a string
             if not isinstance(name, str):
-                if operation == "add":
-                    raise ParameterAddError(
-                        name, parameter_type.name, "Parameter name must be a string"
-                    )
-                elif operation == "update":
-                    raise ParameterUpdateError(
-                        name, parameter_type.name, "Parameter name must be a string"
-                    )
+                raise error_class(name, type_name, "Parameter name must be a string")
 
-            # Validate deployment state
-            if operation == "add" and self._app_deployed:
-                raise RuntimeError(
-                    "The app is currently deployed, cannot add a new parameter right now."
-                )
-
-            if operation == "add":
+            if is_add:
+                # Validate deployment state
+                if self._app_deployed:
+                    raise RuntimeError(
+                        "The app is currently deployed, cannot add a new parameter right now."
+                    )
                 if name in self.parameters:
                     raise ParameterAddError(
-                        name, parameter_type.name, "Parameter already exists!"
+                        name, type_name, "Parameter already exists!"
                     )
 
-            # For updates, validate parameter existence and type
-            if operation == "update":
-                if name not in self.parameters:
+            else:
+                # For updates, validate parameter existence and type
+                parameter = self.parameters.get(name)
+                if parameter is None:
                     raise ParameterUpdateError(
                         name,
-                        parameter_type.name,
+                        type_name,
                         "Parameter not found - you can only update registered parameters!",
                     )
-                if not isinstance(self.parameters[name], parameter_type.value):
-                    msg = f"Parameter called {name} was found but is registered as a different parameter type ({type(self.parameters[name])}). Expecting {parameter_type.value}."
-                    raise ParameterUpdateError(name, parameter_type.name, msg)
+                if not isinstance(parameter, expected_class):
+                    msg = f"Parameter called {name} was found but is registered as a different parameter type ({type(parameter)}). Expecting {expected_class}."
+                    raise ParameterUpdateError(name, type_name, msg)
+
+            result = func(self, name, *args, **kwargs)
+            self._state_revision += 1
 
-            return func(self, name, *args, **kwargs)
+            # Record the change so deployers know which components to sync
+            if not is_add:
+                self._changed_parameters.add(name)
+
+            return result
 
         return wrapper
 
@@ -163,7 +182,8 @@ class Viewer:
     callbacks: Dict[str, List[Callable]]
     _app_deployed: bool
     _in_callbacks: bool
-    _figure: Figure
+    _changed_parameters: set
+    _figure: "Figure"
 
     def __new__(cls, *args, **kwargs):
         instance = super().__new__(cls)
@@ -171,6 +191,11 @@ class Viewer:
         instance.callbacks = {}
         instance._app_deployed = False
         instance._in_callbacks = False
+        instance._changed_parameters = set()
+        instance._state_revision = 0
+        instance._batch_depth = 0
+        instance._batched_parameters = {}
+        instance._state_cache = None
         instance._figure = None
         return instance
 
@@ -192,20 +217,36 @@ class Viewer:
         >>> viewer.state
         {'x': 1.0, 'label': 'data'}
         """
-        return {
-            name: param.value
-            for name, param in self.parameters.items()
-            if not param._is_action
-        }
+        # Rebuilt only after parameters are added, updated, removed or set
+        key = self._state_key()
+        cache = self._state_cache
+        if cache is None or cache[0] != key:
+            state = {
+                name: param.value
+                for name, param in self.parameters.items()
+                if not param._is_action
+            }
+            cache = self._state_cache = (key, state)
+        # Return a copy so callers can't change the cached state
+        return dict(cache[1])
+
+    def _state_key(self) -> Tuple[int, int]:
+        """A key that changes whenever the state may have changed.
+
+        Parameter values can be set directly (viewer.parameters[name].value = ...)
+        instead of through the viewer, so this includes the parameters' shared
+        value revision as well as the viewer's own revision.
+        """
+        return (self._state_revision, _get_value_revision())
 
     @property
-    def figure(self) -> Figure:
+    def figure(self) -> "Figure":
         """
         Get the last opened figure. Returns None if no figure has been opened yet.
         """
         return self._figure
 
-    def plot(self, state: Dict[str, Any]) -> Figure:
+    def plot(self, state: Dict[str, Any]) -> "Figure":
         """Create and return a matplotlib figure.
 
         Hello user! This is a placeholder that raises a NotImplementedError. You must either:
@@ -263,6 +304,52 @@ class Viewer:
         """
         self.plot = self._prepare_function(func, context="Setting plot:")
 
+    def redraw(self, state: Dict[str, Any]) -> None:
+        """Update the current figure in place (optional).
+
+        By default every update calls plot() to build a brand new figure. If your
+        figure layout doesn't change between updates, you can implement redraw()
+        to modify the existing figure instead (e.g. with line.set_ydata() or
+        image.set_data()), which is much faster than building a new one.
+
+        1. Call set_redraw() with your redraw function
+        >>> def redraw(state):
+        >>>     viewer.figure.axes[0].lines[0].set_ydata(...)
+        >>> viewer.set_redraw(redraw)
+
+        2. Subclass Viewer and override this method
+        >>> class YourViewer(Viewer):
+        >>>     def redraw(self, state):
+        >>>         self.figure.axes[0].lines[0].set_ydata(...)
+
+        Parameters
+        ----------
+        state : dict
+            Current parameter values
+
+        Notes
+        -----
+        - The figure to update is available as self.figure (or viewer.figure)
+        - plot() is still used to build the first figure
+        - Don't return anything, the deployer takes care of displaying the figure
+        """
+        return NotImplemented
+
+    def set_redraw(self, func: Callable) -> None:
+        """Set the redraw method for the viewer.
+
+        The input must be a callable function that takes a state dictionary and
+        updates viewer.figure in place. See redraw() for details.
+
+        Examples
+        --------
+        >>> def redraw(state):
+        >>>     viewer.figure.axes[0].lines[0].set_ydata(...)
+        >>> viewer = make_viewer(plot)
+        >>> viewer.set_redraw(redraw)
+        """
+        self.redraw = self._prepare_function(func, context="Setting redraw:")
+
     def show(
         self,
         controls_position: Literal["left", "top", "right", "bottom"] = "left",
@@ -311,6 +398,8 @@ class Viewer:
         open_browser: bool = True,
         update_threshold: float = 1.0,
         timeout_threshold: float = 10.0,
+        image_format: str = "png",
+        cache_plots: bool = True,
     ):
         """
         Share the viewer on a web browser using Flask.
@@ -339,6 +428,14 @@ class Viewer:
             Minimum time in seconds between updates to the viewer (default is 1.0).
         timeout_threshold : float, optional
             Maximum time in seconds to wait for a response before timing out (default is 10.0).
+        image_format : {'png', 'jpeg', 'webp'}, optional
+            Format used to send the figure to the browser (default is 'png'). JPEG and
+            WebP are smaller and faster to encode but lossy, which can blur thin lines
+            and text.
+        cache_plots : bool, optional
+            If True, plots of states that were already shown are reused instead of
+            being rendered again (default is True). Set to False if your plot
+            depends on anything besides the parameters, like the time or random data.
 
         Notes
         -----
@@ -357,6 +454,8 @@ class Viewer:
             open_browser=open_browser,
             update_threshold=update_threshold,
             timeout_threshold=timeout_threshold,
+            image_format=image_format,
+            cache_plots=cache_plots,
         )
 
     def deploy(self, env: str = "notebook", **kwargs):
@@ -519,16 +618,23 @@ class Viewer:
 
     def perform_callbacks(self, name: str) -> bool:
         """Perform callbacks for all parameters that have changed"""
-        if self._in_callbacks:
+        # Most parameters have no callbacks, so return before touching any state
+        callbacks = self.callbacks.get(name)
+        if not callbacks or self._in_callbacks:
             return
+        self._in_callbacks = True
         try:
-            self._in_callbacks = True
-            if name in self.callbacks:
-                for callback in self.callbacks[name]:
-                    callback(self.state)
+            for callback in callbacks:
+                callback(self.state)
         finally:
             self._in_callbacks = False
 
+    def _pop_changed_parameters(self) -> set:
+        """Get the names of parameters changed since the last call and reset them."""
+        changed = self._changed_parameters
+        self._changed_parameters = set()
+        return changed
+
     def on_change(self, parameter_name: Union[str, List[str]], callback: Callable):
         """
         Register a function to run when parameters change.
@@ -552,26 +658,33 @@ class Viewer:
         >>> viewer.on_change(['x', 'y'], lambda s: viewer.plot())  # Update on either change
         """
         if isinstance(parameter_name, str):
-            parameter_name = [parameter_name]
+            parameter_name = (parameter_name,)
 
         callback = self._prepare_function(
             callback,
             context="Setting on_change callback:",
         )
 
+        # Check every name before registering any, so a bad name doesn't leave
+        # the callback registered for some of the parameters
         for param_name in parameter_name:
             if param_name not in self.parameters:
                 raise ValueError(f"Parameter '{param_name}' is not registered!")
-            if param_name not in self.callbacks:
-                self.callbacks[param_name] = []
-            self.callbacks[param_name].append(callback)
+
+        for param_name in parameter_name:
+            self.callbacks.setdefault(param_name, []).append(callback)
 
     def set_parameter_value(self, name: str, value: Any) -> None:
         """
         Update a parameter's value and trigger any callbacks.
 
         This is a lower-level method - usually you'll want to use the update_*
-        methods instead (e.g., update_float, update_text, etc.).
+        methods instead (e.g., update_float, update_text, etc.). Callbacks only
+        run if the value changes.
+
+        Deployers only sync the controls of parameters changed through this
+        method or the update_* methods. Writing to viewer.parameters[name].value
+        directly, or mutating a value in place, isn't reported to them.
 
         Parameters
         ----------
@@ -585,14 +698,62 @@ class Viewer:
         ValueError
             If the parameter doesn't exist or the value is invalid
         """
-        if name not in self.parameters:
+        parameter = self.parameters.get(name)
+        if parameter is None:
             raise ValueError(f"Parameter {name} not found")
 
         # Update the parameter value
-        self.parameters[name].value = value
+        old_value = parameter.value
+        parameter.value = value
+        # Still recorded as changed, so deployers sync components whose value
+        # was rejected or adjusted back to the current one
+        self._changed_parameters.add(name)
+
+        # Nothing to do if the (validated) value didn't change
+        try:
+            unchanged = bool(parameter.value == old_value)
+        except (TypeError, ValueError):
+            unchanged = False
+        if unchanged:
+            return
+        self._state_revision += 1
+
+        # Perform callbacks (once the batch is done if batching updates)
+        if self._batch_depth:
+            self._batched_parameters[name] = None
+        else:
+            self.perform_callbacks(name)
 
-        # Perform callbacks
-        self.perform_callbacks(name)
+    @contextmanager
+    def batch_updates(self):
+        """
+        Set several parameter values before running any of their callbacks.
+
+        Inside the ``with`` block, :meth:`~syd.viewer.Viewer.set_parameter_value`
+        changes values without running callbacks. When the block exits, the
+        callbacks of each changed parameter run once, in the order the parameters
+        were first changed. Batches can be nested, callbacks run when the
+        outermost one exits. If the block raises, the callbacks don't run (values
+        that were already set stay set).
+
+        Examples
+        --------
+        >>> with viewer.batch_updates():
+        ...     viewer.set_parameter_value('x', 2.0)
+        ...     viewer.set_parameter_value('y', 3.0)
+        ...     viewer.set_parameter_value('x', 4.0)  # x's callbacks still run once
+        """
+        self._batch_depth += 1
+        batched = {}
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                batched, self._batched_parameters = self._batched_parameters, {}
+        # Only reached if the block didn't raise
+        for name in batched:
+            self.perform_callbacks(name)
 
     # -------------------- parameter registration methods --------------------
     def remove_parameter(self, name: str) -> None:
@@ -606,6 +767,7 @@ class Viewer:
         """
         if name in self.parameters:
             del self.parameters[name]
+            self._state_revision += 1
 
     @validate_parameter_operation("add", ParameterType.text)
     def add_text(
@@ -1057,6 +1219,14 @@ class Viewer:
             self.parameters[name] = new_param
 
     # -------------------- parameter update methods --------------------
+    def _update_parameter(self, name: str, **fields: Any) -> None:
+        """Update a parameter with the fields that aren't NO_UPDATE (if any)."""
+        updates = {
+            field: value for field, value in fields.items() if not value == NO_UPDATE
+        }
+        if updates:
+            self.parameters[name].update(updates)
+
     @validate_parameter_operation("update", ParameterType.text)
     def update_text(
         self, name: str, *, value: Union[str, NoUpdate] = NO_UPDATE
@@ -1081,11 +1251,7 @@ class Viewer:
         >>> viewer.state['title']
         'New Title'
         """
-        updates = {}
-        if not value == NO_UPDATE:
-            updates["value"] = value
-        if updates:
-            self.parameters[name].update(updates)
+        self._update_parameter(name, value=value)
 
     @validate_parameter_operation("update", ParameterType.boolean)
     def update_boolean(
@@ -1111,11 +1277,7 @@ class Viewer:
         >>> viewer.state['show_grid']
         False
         """
-        updates = {}
-        if not value == NO_UPDATE:
-            updates["value"] = value
-        if updates:
-            self.parameters[name].update(updates)
+        self._update_parameter(name, value=value)
 
     @validate_parameter_operation("update", ParameterType.selection)
     def update_selection(
@@ -1151,13 +1313,7 @@ class Viewer:
         ...                        options=['purple', 'orange'],
         ...                        value='purple')
         """
-        updates = {}
-        if not value == NO_UPDATE:
-            updates["value"] = value
-        if not options == NO_UPDATE:
-            updates["options"] = options
-        if updates:
-            self.parameters[name].update(updates)
+        self._update_parameter(name, value=value, options=options)
 
     @validate_parameter_operation("update", ParameterType.multiple_selection)
     def update_multiple_selection(
@@ -1195,13 +1351,7 @@ class Viewer:
         ...     options=['cheese', 'bacon', 'olives'],
         ...     value=['cheese', 'bacon'])
         """
-        updates = {}
-        if not value == NO_UPDATE:
-            updates["value"] = value
-        if not options == NO_UPDATE:
-            updates["options"] = options
-        if updates:
-            self.parameters[name].update(updates)
+        self._update_parameter(name, value=value, options=options)
 
     @validate_parameter_operation("update", ParameterType.integer)
     def update_integer(
@@ -1242,9 +1392,8 @@ class Viewer:
             updates["min"] = int(min)
         if not isinstance(max, NoUpdate):
             updates["max"] = int(max)
-
-        parameter = self.parameters[name]
-        parameter.update(updates)
+        if updates:
+            self.parameters[name].update(updates)
 
     @validate_parameter_operation("update", ParameterType.float)
     def update_float(
@@ -1290,9 +1439,8 @@ class Viewer:
             updates["max"] = float(max)
         if not isinstance(step, NoUpdate):
             updates["step"] = float(step)
-
-        parameter = self.parameters[name]
-        parameter.update(updates)
+        if updates:
+            self.parameters[name].update(updates)
 
     @validate_parameter_operation("update", ParameterType.integer_range)
     def update_integer_range(
@@ -1334,9 +1482,8 @@ class Viewer:
             updates["min"] = int(min)
         if not isinstance(max, NoUpdate):
             updates["max"] = int(max)
-
-        parameter = self.parameters[name]
-        parameter.update(updates)
+        if updates:
+            self.parameters[name].update(updates)
 
     @validate_parameter_operation("update", ParameterType.float_range)
     def update_float_range(
@@ -1388,9 +1535,8 @@ class Viewer:
             updates["max"] = float(max)
         if not isinstance(step, NoUpdate):
             updates["step"] = float(step)
-
-        parameter = self.parameters[name]
-        parameter.update(updates)
+        if updates:
+            self.parameters[name].update(updates)
 
     @validate_parameter_operation("update", ParameterType.unbounded_integer)
     def update_unbounded_integer(
@@ -1418,11 +1564,7 @@ class Viewer:
         >>> # Update just the value
         >>> viewer.update_unbounded_integer('population', value=2000000)
         """
-        updates = {}
-        if not value == NO_UPDATE:
-            updates["value"] = value
-        if updates:
-            self.parameters[name].update(updates)
+        self._update_parameter(name, value=value)
 
     @validate_parameter_operation("update", ParameterType.unbounded_float)
     def update_unbounded_float(
@@ -1457,13 +1599,7 @@ class Viewer:
         >>> # Remove step size (allow any precision)
         >>> viewer.update_unbounded_float('wavelength', step=None)
         """
-        updates = {}
-        if not value == NO_UPDATE:
-            updates["value"] = value
-        if not step == NO_UPDATE:
-            updates["step"] = step
-        if updates:
-            self.parameters[name].update(updates)
+        self._update_parameter(name, value=value, step=step)
 
     @validate_parameter_operation("update", ActionType.button)
     def update_button(
@@ -0,0 +1,286 @@
+import socket
+import pytest
+import matplotlib.pyplot as plt
+from syd.flask_deployment.deployer import FlaskDeployer, _find_available_port
+from tests.support import MockViewer
+
+
+def make_client(viewer, **kwargs):
+    deployer = FlaskDeployer(viewer, open_browser=False, **kwargs)
+    deployer.build_layout()
+    return deployer, deployer.app.test_client()
+
+
+@pytest.fixture
+def viewer():
+    viewer = MockViewer()
+    viewer.add_float("x", value=1.0, min=0, max=10)
+    viewer.add_float("y", value=1.0, min=0, max=10)
+    viewer.add_text("label", value="a")
+    viewer.on_change("x", lambda state: viewer.update_float("y", value=state["x"]))
+    return viewer
+
+
+def test_update_response_includes_callback_changes(viewer):
+    _, client = make_client(viewer)
+
+    data = client.post("/update-param", json={"name": "x", "value": 3.0}).get_json()
+    assert data["state"] == {"x": 3.0, "y": 3.0}
+    assert set(data["params"]) == {"x", "y"}
+
+    # Changes are only reported once
+    data = client.post("/update-param", json={"name": "label", "value": "b"}).get_json()
+    assert data["state"] == {"label": "b"}
+
+
+def test_init_data_does_not_consume_changes(viewer):
+    def plot(state):
+        viewer.update_text("label", value=f"x={state['x']}")
+        return plt.figure()
+
+    viewer.set_plot(plot)
+    _, client = make_client(viewer)
+    assert client.get("/init-data").get_json()["state"]["label"] == "a"
+
+    # A change made by plot is reported by /init-data (e.g. for another tab)
+    # and still sent with the next update response
+    assert client.get("/plot").status_code == 200
+    assert client.get("/init-data").get_json()["state"]["label"] == "x=1.0"
+    data = client.post("/update-param", json={"name": "y", "value": 2.0}).get_json()
+    assert data["state"] == {"y": 2.0, "label": "x=1.0"}
+
+
+def test_state_version_advances_once_per_update(viewer):
+    _, client = make_client(viewer)
+    version = client.get("/init-data").get_json()["state_version"]
+
+    data = client.post("/update-param", json={"name": "x", "value": 2.0}).get_json()
+    assert data["state_version"] == version + 1
+    updates = [{"name": "x", "value": 4.0}, {"name": "label", "value": "b"}]
+    data = client.post("/update-params", json=updates).get_json()
+    assert data["state_version"] == version + 2
+
+    # A page loaded now starts from the latest version and state
+    data = client.get("/init-data").get_json()
+    assert data["state_version"] == version + 2
+    assert data["state"] == {"x": 4.0, "y": 4.0, "label": "b"}
+
+
+def test_batch_update_reports_errors_per_item(viewer):
+    _, client = make_client(viewer)
+    updates = [
+        {"name": "x", "value": 2.0},
+        1,
+        ["x"],
+        {"name": []},
+        {"value": 3.0},
+        {"name": "missing", "value": 1},
+        {"name": "y", "value": "not a number"},
+        {"name": "label", "value": "b"},
+    ]
+    response = client.post("/update-params", json=updates)
+    assert response.status_code == 200
+    data = response.get_json()
+
+    results = data["results"]
+    assert len(results) == len(updates)
+    assert results[0] == {"name": "x", "success": True}
+    assert results[-1] == {"name": "label", "success": True}
+    assert all("error" in result for result in results[1:-1])
+
+    # The valid updates were still applied
+    assert data["state"] == {"x": 2.0, "y": 2.0, "label": "b"}
+    assert viewer.state == {"x": 2.0, "y": 2.0, "label": "b"}
+
+
+def test_batch_update_requires_a_list(viewer):
+    _, client = make_client(viewer)
+    response = client.post("/update-params", json={"name": "x", "value": 2.0})
+    assert response.status_code == 400
+    assert viewer.state["x"] == 1.0
+
+
+def test_init_data_is_cached_until_state_changes(viewer):
+    _, client = make_client(viewer)
+    response = client.get("/init-data")
+    etag = response.headers["ETag"]
+
+    # Unchanged data is revalidated without resending it
+    response = client.get("/init-data", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    client.post("/update-param", json={"name": "x", "value": 3.0})
+    response = client.get("/init-data", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.get_json()["state"]["y"] == 3.0
+
+    # Values assigned directly to a parameter are picked up too
+    viewer.parameters["label"].value = "direct"
+    assert client.get("/init-data").get_json()["state"]["label"] == "direct"
+
+    # Parameters added after the page loaded are included too
+    viewer.add_integer("n", value=1, min=0, max=5)
+    data = client.get("/init-data").get_json()
+    assert data["param_order"] == ["x", "y", "label", "n"]
+
+
+def test_home_page_is_revalidated(viewer):
+    _, client = make_client(viewer)
+    response = client.get("/")
+    assert response.status_code == 200
+    response = client.get("/", headers={"If-None-Match": response.headers["ETag"]})
+    assert response.status_code == 304
+
+
+def test_plot_is_cached_by_version(viewer):
+    calls = []
+
+    def plot(state):
+        calls.append(state["x"])
+        return plt.figure()
+
+    viewer.set_plot(plot)
+    _, client = make_client(viewer)
+    data = client.post("/update-param", json={"name": "x", "value": 2.0}).get_json()
+    version = data["plot_version"]
+
+    response = client.get(f"/plot?v={version}")
+    assert response.status_code == 200
+    assert response.mimetype == "image/png"
+    assert "immutable" in response.headers["Cache-Control"]
+    etag = response.headers["ETag"]
+    assert calls == [2.0]
+
+    # The browser's copy is revalidated and the server reuses its own copy
+    response = client.get("/plot", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    response = client.get("/plot")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert calls == [2.0]
+
+    # Coming back to a state that was already plotted doesn't plot again
+    client.post("/update-param", json={"name": "x", "value": 3.0})
+    client.get("/plot")
+    data = client.post("/update-param", json={"name": "x", "value": 2.0}).get_json()
+    assert data["plot_version"] == version
+    assert client.get("/plot").headers["ETag"] == etag
+    assert calls == [2.0, 3.0]
+
+
+def test_plot_cache_can_be_disabled(viewer):
+    calls = []
+
+    def plot(state):
+        calls.append(state["x"])
+        return plt.figure()
+
+    viewer.set_plot(plot)
+    _, client = make_client(viewer, cache_plots=False)
+    first = client.post("/update-param", json={"name": "x", "value": 2.0}).get_json()
+    response = client.get(f"/plot?v={first['plot_version']}")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "no-store"
+    assert "ETag" not in response.headers
+
+    # The same state is plotted again, under a new version
+    client.post("/update-param", json={"name": "x", "value": 3.0})
+    second = client.post("/update-param", json={"name": "x", "value": 2.0}).get_json()
+    assert second["plot_version"] != first["plot_version"]
+    client.get("/plot")
+    client.get("/plot")
+    assert calls == [2.0, 2.0, 2.0]
+
+
+def test_plot_uses_redraw_after_first_render(viewer):
+    calls = []
+
+    def plot(state):
+        calls.append(("plot", state["x"]))
+        return plt.figure()
+
+    def redraw(state):
+        calls.append(("redraw", state["x"]))
+
+    viewer.set_plot(plot)
+    viewer.set_redraw(redraw)
+    _, client = make_client(viewer)
+    client.get("/plot")
+    client.post("/update-param", json={"name": "x", "value": 2.0})
+    assert client.get("/plot").status_code == 200
+    assert calls == [("plot", 1.0), ("redraw", 2.0)]
+
+
+def test_redrawn_plot_shows_the_new_state(viewer):
+    def plot(state):
+        fig, ax = plt.subplots()
+        ax.plot([0, 1], [0, state["x"]])
+        ax.set_ylim(0, 10)
+        return fig
+
+    def redraw(state):
+        viewer.figure.axes[0].lines[0].set_ydata([0, state["x"]])
+
+    viewer.set_plot(plot)
+    viewer.set_redraw(redraw)
+    _, client = make_client(viewer)
+    first = client.get("/plot")
+    figure = viewer.figure
+
+    client.post("/update-param", json={"name": "x", "value": 8.0})
+    second = client.get("/plot")
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert second.data != first.data
+    assert viewer.figure is figure
+
+    # The redrawn figure matches the one plot() builds for the same state
+    viewer.set_redraw(lambda state: NotImplemented)
+    client.post("/update-param", json={"name": "x", "value": 5.0})
+    client.get("/plot")
+    client.post("/update-param", json={"name": "x", "value": 8.0})
+    client.post("/update-param", json={"name": "label", "value": "b"})
+    assert client.get("/plot").data == second.data
+
+
+def test_plot_falls_back_to_plot_without_redraw(viewer):
+    calls = []
+
+    def plot(state):
+        calls.append(state["x"])
+        return plt.figure()
+
+    viewer.set_plot(plot)
+    _, client = make_client(viewer)
+    client.get("/plot")
+    client.post("/update-param", json={"name": "x", "value": 2.0})
+    assert client.get("/plot").status_code == 200
+    assert calls == [1.0, 2.0]
+
+
+def test_plot_that_goes_stale_asks_for_a_retry(viewer):
+    client = None
+
+    def plot(state):
+        # Another request updates the state while this plot is rendering
+        if state["x"] == 1.0:
+            client.post("/update-param", json={"name": "x", "value": 2.0})
+        return plt.figure()
+
+    viewer.set_plot(plot)
+    _, client = make_client(viewer)
+    response = client.get("/plot")
+    assert response.status_code == 204
+    assert response.headers["X-Retry"] == "1"
+
+    response = client.get("/plot")
+    assert response.status_code == 200
+
+
+def test_find_available_port_skips_a_port_in_use():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        s.listen()
+        port = s.getsockname()[1]
+        assert _find_available_port(port) != port
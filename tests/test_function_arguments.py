@@ -371,3 +371,30 @@ def test_on_change_with_invalid_callback(name, kind, func):
 
     msg = "Callbacks should not be added when they are not valid"
     assert str(func) not in viewer.callbacks, msg
+
+
+@pytest.mark.parametrize(
+    "name,kind,func",
+    [(name, kind, func) for name, (kind, func) in correct_kind_callable_pairs.items()],
+)
+def test_set_redraw_with_valid_callable(name, kind, func):
+    viewer = make_viewer() if kind == "external" else instance
+    viewer.set_redraw(func)
+    msg = "viewer.redraw should be called with just one positional argument and self implied"
+    assert viewer.redraw(viewer.state), msg
+
+
+@pytest.mark.parametrize(
+    "name,kind,func",
+    [
+        (name, kind, func)
+        for name, (kind, func) in incorrect_kind_callable_pairs.items()
+    ],
+)
+def test_set_redraw_with_invalid_callable(name, kind, func):
+    viewer = make_viewer()
+    with pytest.raises(ValueError):
+        viewer.set_redraw(func)
+
+    msg = "viewer.redraw should return NotImplemented if no redraw function is set"
+    assert viewer.redraw(viewer.state) is NotImplemented, msg
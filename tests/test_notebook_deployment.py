@@ -1,3 +1,8 @@
+import pytest
+import matplotlib.pyplot as plt
+from syd.notebook_deployment.deployer import NotebookDeployer
+from tests.support import MockViewer
+
 # import pytest
 # from unittest.mock import Mock, patch
 # import ipywidgets as widgets
@@ -165,3 +170,76 @@
 #             with patch.object(deployment, "_sync_widgets_with_state"):
 #                 deployment._handle_widget_engagement("text_param")
 #                 mock_update_plot.assert_called_once()
+
+
+def make_deployer(viewer, plotted_states=None):
+    def plot(state):
+        if plotted_states is not None:
+            plotted_states.append(state)
+        return plt.figure()
+
+    viewer.set_plot(plot)
+    with pytest.warns(UserWarning):
+        # The test backend isn't a notebook backend
+        deployer = NotebookDeployer(viewer)
+    deployer.backend_type = "inline"
+    deployer.build_components()
+    deployer.build_layout()
+    return deployer
+
+
+def test_callback_changes_are_synced_to_components():
+    viewer = MockViewer()
+    viewer.add_float("x", value=1.0, min=0, max=10)
+    viewer.add_float("y", value=1.0, min=0, max=10)
+    viewer.on_change("x", lambda state: viewer.update_float("y", value=state["x"]))
+    deployer = make_deployer(viewer)
+
+    deployer.components["x"].widget.value = 4.0
+    assert viewer.state["y"] == 4.0
+    assert deployer.components["y"].value == 4.0
+
+
+def test_action_changes_are_synced_to_components():
+    viewer = MockViewer()
+    viewer.add_text("label", value="a")
+
+    def reset(state):
+        # Written directly, so the viewer doesn't record the change
+        viewer.parameters["label"].value = "reset"
+
+    viewer.add_button("reset", label="Reset", callback=reset)
+    plotted_states = []
+    deployer = make_deployer(viewer, plotted_states)
+
+    deployer.components["reset"].widget.click()
+    assert deployer.components["label"].value == "reset"
+    assert viewer.state["label"] == "reset"
+    assert plotted_states[-1]["label"] == "reset"
+
+
+def test_update_plot_uses_redraw_after_first_plot():
+    viewer = MockViewer()
+    viewer.add_float("x", value=1.0, min=0, max=10)
+    plotted_states = []
+    deployer = make_deployer(viewer, plotted_states)
+    redrawn_states = []
+    viewer.set_redraw(lambda state: redrawn_states.append(state))
+
+    deployer.update_plot()
+    figure = viewer.figure
+    deployer.components["x"].widget.value = 2.0
+    assert [state["x"] for state in plotted_states] == [1.0]
+    assert [state["x"] for state in redrawn_states] == [2.0]
+    assert viewer.figure is figure
+
+
+def test_update_plot_falls_back_to_plot_without_redraw():
+    viewer = MockViewer()
+    viewer.add_float("x", value=1.0, min=0, max=10)
+    plotted_states = []
+    deployer = make_deployer(viewer, plotted_states)
+
+    deployer.update_plot()
+    deployer.components["x"].widget.value = 2.0
+    assert [state["x"] for state in plotted_states] == [1.0, 2.0]
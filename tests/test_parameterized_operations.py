@@ -522,3 +522,21 @@ def test_parameter_type_compatibility(param_type1, param_type2):
         add_method1(param_name, **kwargs1)
     with pytest.raises(ParameterUpdateError):
         update_method1(param_name, **kwargs1)
+
+
+def test_selection_membership_after_options_change():
+    viewer = MockViewer()
+    viewer.add_selection("sel", value="a", options=["a", "b", "c"])
+
+    # Options replaced through an update are used for later validation
+    viewer.update_selection("sel", options=["x", "y"], value="y")
+    viewer.update_selection("sel", value="x")
+    assert viewer.parameters["sel"].value == "x"
+    with check_no_change(viewer, "sel"):
+        with pytest.raises(ParameterUpdateError):
+            viewer.update_selection("sel", value="a")
+
+    # Unhashable values are rejected rather than raising a TypeError
+    with check_no_change(viewer, "sel"):
+        with pytest.raises(ParameterUpdateError):
+            viewer.update_selection("sel", value=["x"])
@@ -1,6 +1,8 @@
 import pytest
 from syd.parameters import ParameterType, TextParameter
 from syd.viewer import Viewer, validate_parameter_operation
+from syd.support import ParameterUpdateWarning
+from tests.support import MockViewer
 
 with pytest.raises(ValueError):
 
@@ -33,3 +35,104 @@ with pytest.raises(ValueError):
         @validate_parameter_operation("update", ParameterType.text)
         def add_alternate_parameter(self, name, value):
             self.parameters[name] = TextParameter(name, value)
+
+
+def test_changed_parameters_are_tracked():
+    viewer = MockViewer()
+    viewer.add_float("x", value=1.0, min=0, max=10)
+    viewer.add_float("y", value=1.0, min=0, max=10)
+    viewer.add_text("label", value="a")
+    viewer.on_change("x", lambda state: viewer.update_float("y", value=state["x"]))
+    viewer._pop_changed_parameters()
+
+    # Direct changes and changes made by callbacks are both recorded
+    viewer.set_parameter_value("x", 2.0)
+    assert viewer._pop_changed_parameters() == {"x", "y"}
+    assert viewer._pop_changed_parameters() == set()
+
+    viewer.update_text("label", value="b")
+    assert viewer._pop_changed_parameters() == {"label"}
+
+
+def test_state_is_rebuilt_after_changes():
+    viewer = MockViewer()
+    viewer.add_float("x", value=1.0, min=0, max=10)
+    viewer.add_text("label", value="a")
+    assert viewer.state == {"x": 1.0, "label": "a"}
+
+    # Changing the returned dictionary doesn't change the viewer's state
+    viewer.state["x"] = 5.0
+    assert viewer.state["x"] == 1.0
+
+    viewer.set_parameter_value("x", 2.0)
+    assert viewer.state["x"] == 2.0
+
+    viewer.update_text("label", value="b")
+    assert viewer.state["label"] == "b"
+
+    viewer.add_integer("n", value=3, min=0, max=5)
+    assert viewer.state == {"x": 2.0, "label": "b", "n": 3}
+
+    viewer.remove_parameter("n")
+    assert "n" not in viewer.state
+
+    # Values assigned directly to a parameter are seen too
+    viewer.parameters["label"].value = "c"
+    assert viewer.state["label"] == "c"
+
+
+def test_batch_updates_defers_callbacks():
+    viewer = MockViewer()
+    viewer.add_float("x", value=1.0, min=0, max=10)
+    viewer.add_float("y", value=1.0, min=0, max=10)
+    calls = []
+    viewer.on_change("x", lambda state: calls.append(("x", state["x"], state["y"])))
+    viewer.on_change("y", lambda state: calls.append(("y", state["x"], state["y"])))
+
+    with viewer.batch_updates():
+        viewer.set_parameter_value("x", 2.0)
+        with viewer.batch_updates():
+            viewer.set_parameter_value("y", 3.0)
+        viewer.set_parameter_value("x", 4.0)
+        assert calls == []
+
+    # Each callback runs once, after all values were set
+    assert calls == [("x", 4.0, 3.0), ("y", 4.0, 3.0)]
+
+    viewer.set_parameter_value("y", 5.0)
+    assert calls[-1] == ("y", 4.0, 5.0)
+
+
+def test_batch_updates_skips_callbacks_when_block_raises():
+    viewer = MockViewer()
+    viewer.add_float("x", value=1.0, min=0, max=10)
+    calls = []
+    viewer.on_change("x", lambda state: calls.append(state["x"]))
+
+    with pytest.raises(RuntimeError):
+        with viewer.batch_updates():
+            viewer.set_parameter_value("x", 2.0)
+            raise RuntimeError("failed batch")
+    assert calls == []
+
+    # The failed batch doesn't leak into the next update
+    viewer.set_parameter_value("x", 3.0)
+    assert calls == [3.0]
+
+
+def test_set_parameter_value_skips_callbacks_without_change():
+    viewer = MockViewer()
+    viewer.add_integer("n", value=5, min=0, max=10)
+    calls = []
+    viewer.on_change("n", lambda state: calls.append(state["n"]))
+
+    viewer.set_parameter_value("n", 5)
+    assert calls == []
+
+    # A value that is clipped back to the current one is still recorded
+    viewer.set_parameter_value("n", 10)
+    viewer._pop_changed_parameters()
+    with pytest.warns(ParameterUpdateWarning):
+        viewer.set_parameter_value("n", 15)
+    assert calls == [10]
+    assert viewer._pop_changed_parameters() == {"n"}